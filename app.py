@@ -8,14 +8,33 @@ Enhanced Flask application with:
 - Improved UI and user experience
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import BadRequest, HTTPException
 import os
+import hashlib
+import time
+from functools import wraps
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 from dotenv import load_dotenv
 import logging
+import threading
 
 from services import UptimeRobotService, UptimeKumaService
-from services.uptime_robot import UptimeRobotException
-from services.uptime_kuma import UptimeKumaException
+from services.cache import TTLCache
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from services.uptime_robot import UptimeRobotException, UptimeRobotNotFoundException
+from services.uptime_kuma import UptimeKumaException, UptimeKumaNotFoundException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 # Load environment variables
 load_dotenv()
@@ -30,29 +49,294 @@ logger = logging.getLogger(__name__)
 # Initialize Flask app
 app = Flask(__name__)
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, using Flask's encoder for unsupported types."""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
+# Compress JSON and page responses (brotli is preferred when installed)
+app.config['COMPRESS_MIMETYPES'] = [
+    'application/json',
+    'text/html',
+    'text/css',
+    'application/javascript',
+    'text/javascript'
+]
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 512
+# Compressing a streamed response buffers all of it first, which defeats streaming
+app.config['COMPRESS_STREAMS'] = False
+
+if Compress is not None:
+    Compress(app)
+
 # Load configuration from environment variables
 UPTIME_ROBOT_API_KEY = os.getenv('UPTIME_ROBOT_API_KEY', '')
 UPTIME_KUMA_URL = os.getenv('UPTIME_KUMA_URL', '')
 UPTIME_KUMA_USERNAME = os.getenv('UPTIME_KUMA_USERNAME', '')
 UPTIME_KUMA_PASSWORD = os.getenv('UPTIME_KUMA_PASSWORD', '')
+ROBOT_CONFIGURED = bool(UPTIME_ROBOT_API_KEY)
+KUMA_CONFIGURED = bool(UPTIME_KUMA_URL and UPTIME_KUMA_USERNAME and UPTIME_KUMA_PASSWORD)
+
+# Configuration is fixed at startup, so the /api/status body never changes
+_STATUS_BODY = app.json.dumps({
+    'uptime_robot_configured': ROBOT_CONFIGURED,
+    'uptime_kuma_configured': KUMA_CONFIGURED
+})
+# Liveness never depends on the upstream services, so its body is fixed too
+_HEALTHZ_BODY = b'{"status":"ok"}'
+UPSTREAM_TIMEOUT = float(os.getenv('UPSTREAM_TIMEOUT', '30'))
+UPSTREAM_WORKERS = int(os.getenv('UPSTREAM_WORKERS', '8'))
+API_CACHE_TTL = float(os.getenv('API_CACHE_TTL', '5'))
+FLASK_DEBUG = os.getenv('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes')
+# Loopback by default; set HOST=0.0.0.0 to serve without a reverse proxy
+HOST = os.getenv('HOST', '127.0.0.1')
+
+# Monitor type used when an add request doesn't specify one
+_DEFAULT_ROBOT_TYPE = UptimeRobotService.MONITOR_TYPE_HTTP
+
+# Shared pool for fanning out independent upstream calls
+upstream_executor = ThreadPoolExecutor(max_workers=UPSTREAM_WORKERS, thread_name_prefix='upstream')
+
+# Short-lived cache so dashboard polling doesn't re-query upstream every time
+api_cache = TTLCache(ttl=API_CACHE_TTL, maxsize=64)
+
+ROBOT_MONITORS_KEY = ('robot_monitors',)
+ROBOT_STATUS_PAGES_KEY = ('robot_status_pages',)
+KUMA_MONITORS_KEY = ('kuma_monitors',)
+KUMA_STATUS_PAGES_KEY = ('kuma_status_pages',)
+
+
+def _cached_get(key, loader):
+    """Return the cached value for key, calling loader on a miss."""
+    return api_cache.get_or_load(key, loader)
+
+
+# Breaker so a dead Uptime Kuma fails fast instead of stalling requests
+# (UptimeRobotService has its own, around every API request)
+_kuma_cb = CircuitBreaker(failure_threshold=3, reset_timeout=30, name='Uptime Kuma',
+                          ignored_exceptions=(UptimeKumaNotFoundException,))
+
+
+def _robot_monitors(service):
+    """Get Uptime Robot monitors through the cache."""
+    return _cached_get(ROBOT_MONITORS_KEY, service.get_monitors)
+
+
+def _index_pages(pages, field):
+    """Pair a status page list with a {field: page} lookup, for caching together."""
+    return pages, {p.get(field): p for p in pages}
+
+
+def _robot_status_pages(service):
+    """Get Uptime Robot status pages through the cache."""
+    return _robot_status_pages_indexed(service)[0]
+
+
+def _robot_status_pages_indexed(service):
+    """Get Uptime Robot status pages as (pages, pages_by_id)."""
+    return _cached_get(ROBOT_STATUS_PAGES_KEY, lambda: _index_pages(
+        service.get_status_pages(), 'id'))
+
+
+def _kuma_monitors(service):
+    """Get Uptime Kuma monitors through the cache and circuit breaker."""
+    return _cached_get(KUMA_MONITORS_KEY, lambda: _kuma_cb.call(service.get_monitors))
+
+
+def _kuma_status_pages(service):
+    """Get Uptime Kuma status pages through the cache and circuit breaker."""
+    return _kuma_status_pages_indexed(service)[0]
+
+
+def _kuma_status_pages_indexed(service):
+    """Get Uptime Kuma status pages as (pages, pages_by_slug)."""
+    return _cached_get(KUMA_STATUS_PAGES_KEY, lambda: _index_pages(
+        _kuma_cb.call(service.get_status_pages), 'slug'))
+
+
+def _robot_status_page_key(page_id):
+    """Cache key for a single Uptime Robot status page."""
+    return ('robot_status_page', page_id)
+
+
+def _get_robot_status_page(service, page_id):
+    """Get a single Uptime Robot status page, or None if it doesn't exist."""
+    # Reuse the full list when it is already cached, otherwise fetch just this page
+    cached = api_cache.get(ROBOT_STATUS_PAGES_KEY)
+    if cached is not None:
+        return cached[1].get(page_id)
+    
+    try:
+        return _cached_get(_robot_status_page_key(page_id),
+                           lambda: service.get_status_page(page_id))
+    except UptimeRobotNotFoundException:
+        return None
+
+
+# Service instances are reused across requests so sessions and logins persist
+_services = {}
+_services_lock = threading.Lock()
 
 
 def get_uptime_robot_service() -> UptimeRobotService:
     """Get or create Uptime Robot service instance."""
-    if not UPTIME_ROBOT_API_KEY:
+    if not ROBOT_CONFIGURED:
         raise ValueError("Uptime Robot API key not configured")
-    return UptimeRobotService(api_key=UPTIME_ROBOT_API_KEY)
+    with _services_lock:
+        service = _services.get('uptime_robot')
+        if service is None:
+            # api_cache already holds Robot reads for API_CACHE_TTL, so the
+            # service's own response cache would only make them staler
+            service = UptimeRobotService(api_key=UPTIME_ROBOT_API_KEY, cache_ttl=0)
+            _services['uptime_robot'] = service
+        return service
 
 
 def get_uptime_kuma_service() -> UptimeKumaService:
     """Get or create Uptime Kuma service instance."""
-    if not all([UPTIME_KUMA_URL, UPTIME_KUMA_USERNAME, UPTIME_KUMA_PASSWORD]):
+    if not KUMA_CONFIGURED:
         raise ValueError("Uptime Kuma credentials not configured")
-    return UptimeKumaService(
-        url=UPTIME_KUMA_URL,
-        username=UPTIME_KUMA_USERNAME,
-        password=UPTIME_KUMA_PASSWORD
-    )
+    with _services_lock:
+        service = _services.get('uptime_kuma')
+        # The service reconnects on its own if its socket drops
+        if service is None:
+            service = UptimeKumaService(
+                url=UPTIME_KUMA_URL,
+                username=UPTIME_KUMA_USERNAME,
+                password=UPTIME_KUMA_PASSWORD
+            )
+            _services['uptime_kuma'] = service
+        return service
+
+
+def _json() -> dict:
+    """
+    Parse the request's JSON body once, returning {} if it is missing or malformed.
+    
+    Raises:
+        _BadRequest: If the body is valid JSON but not an object
+    """
+    data = request.get_json(cache=True, silent=True)
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise _BadRequest('JSON body must be an object')
+    return data
+
+
+class _BadRequest(BadRequest):
+    """Malformed field in a request body, answered with a 400 JSON error."""
+    pass
+
+
+def _coerce_id(value, field: str = 'id') -> int:
+    """
+    Convert a request field to an int.
+    
+    Raises:
+        _BadRequest: If the value is not an integer, so bad input is a 400
+            rather than being mistaken for a service ValueError
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise _BadRequest(f'{field} must be an integer')
+
+
+# Errors from the upstream services whose message is safe to show as-is
+SERVICE_ERRORS = (ValueError, UptimeRobotException, UptimeKumaException, CircuitOpenError)
+
+
+def api_handler(error_payload: dict = None, error_status: int = 200):
+    """
+    Wrap an API route with the shared error handling.
+    
+    Service errors (including "not configured" and open circuits) are logged
+    and returned as `{**error_payload, 'error': message}`; an upstream call
+    that outlives UPSTREAM_TIMEOUT is answered the same way with a 504;
+    anything else is logged with its traceback and reported as an unexpected
+    error. HTTP exceptions raised by Flask/werkzeug are passed through untouched.
+    
+    Args:
+        error_payload: Fields sent along with the error, e.g. {'monitors': []}
+        error_status: HTTP status code of error responses (default: 200)
+    """
+    payload = error_payload or {}
+    
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return view(*args, **kwargs)
+            except HTTPException:
+                raise
+            except SERVICE_ERRORS as e:
+                logger.warning("%s failed: %s", view.__name__, e)
+                message = str(e)
+            except FutureTimeoutError:
+                logger.warning("%s timed out after %.0fs waiting for upstream",
+                               view.__name__, UPSTREAM_TIMEOUT)
+                return jsonify({**payload, 'error': (
+                    f'Upstream service did not respond within {UPSTREAM_TIMEOUT:.0f}s')}), 504
+            except Exception as e:
+                logger.exception("Unexpected error in %s", view.__name__)
+                message = f'Unexpected error: {str(e)}'
+            finally:
+                logger.debug("%s took %.1f ms", view.__name__,
+                             (time.perf_counter() - started) * 1000)
+            
+            return jsonify({**payload, 'error': message}), error_status
+        return wrapper
+    return decorator
+
+
+# Rendered HTML for the template-only pages, keyed by template name
+_rendered_pages = {}
+PAGE_MAX_AGE = 300
+
+
+def _render_page(template_name: str) -> Response:
+    """
+    Serve a template that has no per-request context.
+    
+    The HTML is rendered once and sent with Cache-Control and ETag headers,
+    so browsers revalidate with If-None-Match and get a 304 when unchanged.
+    Templates are re-rendered on every request in debug mode.
+    """
+    page = _rendered_pages.get(template_name)
+    if page is None or app.debug:
+        html = render_template(template_name)
+        page = (html, hashlib.md5(html.encode('utf-8')).hexdigest())
+        _rendered_pages[template_name] = page
+    
+    html, etag = page
+    
+    # Flask-Compress suffixes ETags with the content encoding ("abc:br"),
+    # so only the part before the suffix is compared
+    client_tags = request.if_none_match.as_set(include_weak=True)
+    if any(tag.split(':', 1)[0] == etag for tag in client_tags):
+        response = Response(status=304)
+    else:
+        response = Response(html, mimetype='text/html')
+    
+    response.cache_control.public = True
+    response.cache_control.max_age = PAGE_MAX_AGE
+    response.set_etag(etag)
+    return response
 
 
 # ==================== ROUTES ====================
@@ -60,666 +344,609 @@ def get_uptime_kuma_service() -> UptimeKumaService:
 @app.route('/')
 def index():
     """Main dashboard page."""
-    return render_template('dashboard.html')
+    return _render_page('dashboard.html')
 
 
 @app.route('/status-pages')
 def status_pages():
     """Status pages management page."""
-    return render_template('status_pages.html')
+    return _render_page('status_pages.html')
 
 @app.route('/monitor-detail')
 def monitor_detail():
     """Monitor detail page with comprehensive metrics."""
-    return render_template('monitor_detail.html')
+    return _render_page('monitor_detail.html')
 
 @app.route('/api/status')
 def get_status():
     """Get overall configuration status of both services."""
-    robot_configured = bool(UPTIME_ROBOT_API_KEY)
-    kuma_configured = bool(UPTIME_KUMA_URL and UPTIME_KUMA_USERNAME and UPTIME_KUMA_PASSWORD)
+    return Response(_STATUS_BODY, mimetype='application/json')
+
+
+@app.route('/healthz')
+def healthz():
+    """Liveness probe: answers without touching either upstream service."""
+    return Response(_HEALTHZ_BODY, mimetype='application/json')
+
+
+@app.route('/readyz')
+def readyz():
+    """
+    Readiness probe: checks that every configured service can be reached.
+    
+    The checks go through the cached monitor lists (and circuit breakers),
+    so frequent probes don't add upstream API calls. Returns 503 when any
+    configured service is unavailable.
+    """
+    checks = {}
+    if ROBOT_CONFIGURED:
+        checks['uptime_robot'] = upstream_executor.submit(
+            lambda: _robot_monitors(get_uptime_robot_service()))
+    if KUMA_CONFIGURED:
+        checks['uptime_kuma'] = upstream_executor.submit(
+            lambda: _kuma_monitors(get_uptime_kuma_service()))
     
-    return jsonify({
-        'uptime_robot_configured': robot_configured,
-        'uptime_kuma_configured': kuma_configured
-    })
+    services = {'uptime_robot': 'not_configured', 'uptime_kuma': 'not_configured'}
+    ready = True
+    for key, future in checks.items():
+        try:
+            future.result(timeout=UPSTREAM_TIMEOUT)
+            services[key] = 'ok'
+        except Exception as e:
+            logger.warning("Readiness check for %s failed: %s", key, e)
+            services[key] = 'unavailable'
+            ready = False
+    
+    body = {'status': 'ok' if ready else 'unavailable', 'services': services}
+    return jsonify(body), 200 if ready else 503
 
 
 # ==================== UPTIME ROBOT ROUTES ====================
 
 @app.route('/api/uptime-robot/monitors')
+@api_handler({'monitors': []})
 def api_uptime_robot_monitors():
     """Get all Uptime Robot monitors."""
-    try:
-        service = get_uptime_robot_service()
-        monitors = service.get_monitors()
-        return jsonify({'monitors': monitors})
-        
-    except ValueError as e:
-        logger.warning(f"Uptime Robot not configured: {e}")
-        return jsonify({'error': 'API key not configured', 'monitors': []})
-    except UptimeRobotException as e:
-        logger.error(f"Uptime Robot error: {e}")
-        return jsonify({'error': str(e), 'monitors': []})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'error': f'Unexpected error: {str(e)}', 'monitors': []})
+    service = get_uptime_robot_service()
+    monitors = _robot_monitors(service)
+    return jsonify({'monitors': monitors})
 
 
 @app.route('/api/uptime-robot/monitor/add', methods=['POST'])
+@api_handler({'success': False})
 def add_uptime_robot_monitor():
     """Add a new monitor to Uptime Robot - Fixed for all monitor types."""
-    try:
-        service = get_uptime_robot_service()
-        data = request.get_json()
-        
-        if not data.get('friendly_name'):
-            return jsonify({'success': False, 'error': 'Name is required'})
-        
-        monitor_type = data.get('type', UptimeRobotService.MONITOR_TYPE_HTTP)
-        
-        # Build base parameters
-        params = {
-            'name': data['friendly_name'],
-            'monitor_type': monitor_type,
-            'interval': data.get('interval', 300)
-        }
-        
-        # Add type-specific parameters
-        if monitor_type == 1:  # HTTP(s)
-            if not data.get('url'):
-                return jsonify({'success': False, 'error': 'URL is required for HTTP monitors'})
-            params['url'] = data['url']
-            
-        elif monitor_type == 2:  # Keyword
-            if not data.get('url'):
-                return jsonify({'success': False, 'error': 'URL is required for Keyword monitors'})
-            if not data.get('keyword_value'):
-                return jsonify({'success': False, 'error': 'Keyword is required for Keyword monitors'})
-            params['url'] = data['url']
-            params['keyword_value'] = data['keyword_value']
-            params['keyword_type'] = data.get('keyword_type', 1)  # 1 = exists, 2 = not exists
-            
-        elif monitor_type == 3:  # Ping
-            if not data.get('url'):
-                return jsonify({'success': False, 'error': 'Hostname is required for Ping monitors'})
-            params['url'] = data['url']  # For Uptime Robot, Ping uses 'url' field for hostname
-            
-        elif monitor_type == 4:  # Port
-            if not data.get('url'):
-                return jsonify({'success': False, 'error': 'Hostname is required for Port monitors'})
-            if not data.get('port'):
-                return jsonify({'success': False, 'error': 'Port number is required for Port monitors'})
-            params['url'] = data['url']  # Hostname goes in 'url' field
-            params['port'] = int(data['port'])
-            params['sub_type'] = data.get('sub_type', 1)  # 1 = Custom port
-        
-        # Create the monitor
-        monitor = service.add_monitor(**params)
-        
-        return jsonify({'success': True, 'monitor': monitor})
-        
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except UptimeRobotException as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'})
+    service = get_uptime_robot_service()
+    data = _json()
+    
+    if not data.get('friendly_name'):
+        return jsonify({'success': False, 'error': 'Name is required'})
+    
+    monitor_type = data.get('type', _DEFAULT_ROBOT_TYPE)
+    
+    # Build base parameters
+    params = {
+        'name': data['friendly_name'],
+        'monitor_type': monitor_type,
+        'interval': data.get('interval', 300)
+    }
+    
+    # Add type-specific parameters
+    if monitor_type == 1:  # HTTP(s)
+        if not data.get('url'):
+            return jsonify({'success': False, 'error': 'URL is required for HTTP monitors'})
+        params['url'] = data['url']
+        
+    elif monitor_type == 2:  # Keyword
+        if not data.get('url'):
+            return jsonify({'success': False, 'error': 'URL is required for Keyword monitors'})
+        if not data.get('keyword_value'):
+            return jsonify({'success': False, 'error': 'Keyword is required for Keyword monitors'})
+        params['url'] = data['url']
+        params['keyword_value'] = data['keyword_value']
+        params['keyword_type'] = data.get('keyword_type', 1)  # 1 = exists, 2 = not exists
+        
+    elif monitor_type == 3:  # Ping
+        if not data.get('url'):
+            return jsonify({'success': False, 'error': 'Hostname is required for Ping monitors'})
+        params['url'] = data['url']  # For Uptime Robot, Ping uses 'url' field for hostname
+        
+    elif monitor_type == 4:  # Port
+        if not data.get('url'):
+            return jsonify({'success': False, 'error': 'Hostname is required for Port monitors'})
+        if not data.get('port'):
+            return jsonify({'success': False, 'error': 'Port number is required for Port monitors'})
+        params['url'] = data['url']  # Hostname goes in 'url' field
+        params['port'] = _coerce_id(data['port'], 'port')
+        params['sub_type'] = data.get('sub_type', 1)  # 1 = Custom port
+    
+    # Create the monitor
+    monitor = service.add_monitor(**params)
+    api_cache.invalidate(ROBOT_MONITORS_KEY, ROBOT_STATUS_PAGES_KEY)
+    
+    return jsonify({'success': True, 'monitor': monitor})
 
 
 @app.route('/api/uptime-robot/monitor/edit', methods=['POST'])
+@api_handler({'success': False})
 def edit_uptime_robot_monitor():
     """Edit an existing Uptime Robot monitor."""
-    try:
-        service = get_uptime_robot_service()
-        data = request.get_json()
-        
-        if not data.get('id'):
-            return jsonify({'success': False, 'error': 'Monitor ID is required'})
-        
-        monitor_id = int(data['id'])
-        update_data = {k: v for k, v in data.items() if k != 'id' and v is not None}
-        
-        service.edit_monitor(monitor_id, **update_data)
-        
-        return jsonify({'success': True})
-        
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except UptimeRobotException as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'})
+    service = get_uptime_robot_service()
+    data = _json()
+    
+    if not data.get('id'):
+        return jsonify({'success': False, 'error': 'Monitor ID is required'})
+    
+    monitor_id = _coerce_id(data.pop('id'))
+    update_data = {k: v for k, v in data.items() if v is not None}
+    
+    service.edit_monitor(monitor_id, **update_data)
+    api_cache.invalidate(ROBOT_MONITORS_KEY, ROBOT_STATUS_PAGES_KEY)
+    
+    return jsonify({'success': True})
 
 
 @app.route('/api/uptime-robot/monitor/delete', methods=['POST'])
+@api_handler({'success': False})
 def delete_uptime_robot_monitor():
     """Delete an Uptime Robot monitor."""
-    try:
-        service = get_uptime_robot_service()
-        data = request.get_json()
-        
-        if not data.get('id'):
-            return jsonify({'success': False, 'error': 'Monitor ID is required'})
-        
-        service.delete_monitor(int(data['id']))
-        
-        return jsonify({'success': True})
-        
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except UptimeRobotException as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'})
+    service = get_uptime_robot_service()
+    data = _json()
+    
+    if not data.get('id'):
+        return jsonify({'success': False, 'error': 'Monitor ID is required'})
+    
+    service.delete_monitor(_coerce_id(data['id']))
+    api_cache.invalidate(ROBOT_MONITORS_KEY, ROBOT_STATUS_PAGES_KEY)
+    
+    return jsonify({'success': True})
 
 
 # ==================== UPTIME ROBOT STATUS PAGE ROUTES ====================
 
 @app.route('/api/uptime-robot/status-pages')
+@api_handler({'status_pages': []})
 def api_uptime_robot_status_pages():
     """Get all Uptime Robot status pages."""
-    try:
-        service = get_uptime_robot_service()
-        pages = service.get_status_pages()
-        return jsonify({'status_pages': pages})
-    except ValueError as e:
-        return jsonify({'error': str(e), 'status_pages': []})
-    except UptimeRobotException as e:
-        return jsonify({'error': str(e), 'status_pages': []})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'error': f'Unexpected error: {str(e)}', 'status_pages': []})
+    service = get_uptime_robot_service()
+    pages = _robot_status_pages(service)
+    return jsonify({'status_pages': pages})
 
 
 @app.route('/api/uptime-robot/status-page/add', methods=['POST'])
+@api_handler({'success': False})
 def add_uptime_robot_status_page():
     """Add a new Uptime Robot status page."""
-    try:
-        service = get_uptime_robot_service()
-        data = request.get_json()
-        
-        if not data.get('friendly_name'):
-            return jsonify({'success': False, 'error': 'Friendly name is required'})
-        
-        # Get monitors to include
-        monitors = data.get('monitors', [])
-        
-        page = service.add_status_page(
-            friendly_name=data['friendly_name'],
-            monitors=monitors,
-            custom_domain=data.get('custom_domain'),
-            sort=data.get('sort', 1)
-        )
-        
-        return jsonify({'success': True, 'page': page})
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except UptimeRobotException as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'})
+    service = get_uptime_robot_service()
+    data = _json()
+    
+    if not data.get('friendly_name'):
+        return jsonify({'success': False, 'error': 'Friendly name is required'})
+    
+    # Get monitors to include
+    monitors = data.get('monitors', [])
+    
+    page = service.add_status_page(
+        friendly_name=data['friendly_name'],
+        monitors=monitors,
+        custom_domain=data.get('custom_domain'),
+        sort=data.get('sort', 1)
+    )
+    api_cache.invalidate(ROBOT_STATUS_PAGES_KEY)
+    
+    return jsonify({'success': True, 'page': page})
 
 
 @app.route('/api/uptime-robot/status-page/delete', methods=['POST'])
+@api_handler({'success': False})
 def delete_uptime_robot_status_page():
     """Delete an Uptime Robot status page."""
-    try:
-        service = get_uptime_robot_service()
-        data = request.get_json()
-        
-        if not data.get('id'):
-            return jsonify({'success': False, 'error': 'Status page ID is required'})
-        
-        service.delete_status_page(int(data['id']))
-        return jsonify({'success': True})
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except UptimeRobotException as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'})
+    service = get_uptime_robot_service()
+    data = _json()
+    
+    if not data.get('id'):
+        return jsonify({'success': False, 'error': 'Status page ID is required'})
+    
+    page_id = _coerce_id(data['id'])
+    service.delete_status_page(page_id)
+    api_cache.invalidate(ROBOT_STATUS_PAGES_KEY, _robot_status_page_key(page_id))
+    return jsonify({'success': True})
 
 
 # ==================== UPTIME KUMA ROUTES ====================
 
 @app.route('/api/uptime-kuma/monitors')
+@api_handler({'monitors': []})
 def api_uptime_kuma_monitors():
     """Get all Uptime Kuma monitors."""
-    try:
-        service = get_uptime_kuma_service()
-        monitors = service.get_monitors()
-        return jsonify({'monitors': monitors})
-        
-    except ValueError as e:
-        logger.warning(f"Uptime Kuma not configured: {e}")
-        return jsonify({'error': 'Credentials not configured', 'monitors': []})
-    except UptimeKumaException as e:
-        logger.error(f"Uptime Kuma error: {e}")
-        return jsonify({'error': str(e), 'monitors': []})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'error': f'Unexpected error: {str(e)}', 'monitors': []})
+    service = get_uptime_kuma_service()
+    monitors = _kuma_monitors(service)
+    return jsonify({'monitors': monitors})
 
 
 @app.route('/api/uptime-kuma/monitor/add', methods=['POST'])
+@api_handler({'success': False})
 def add_uptime_kuma_monitor():
     """Add a new monitor to Uptime Kuma - Fixed for all monitor types."""
-    try:
-        service = get_uptime_kuma_service()
-        data = request.get_json()
-        
-        if not data.get('name'):
-            return jsonify({'success': False, 'error': 'Name is required'})
-        
-        # Build the monitor parameters based on type
-        monitor_type = data.get('type', 'http')
-        params = {
-            'name': data['name'],
-            'monitor_type': monitor_type,
-            'interval': data.get('interval', 60)
-        }
-        
-        # Add type-specific parameters
-        if monitor_type == 'http':
-            # HTTP monitor needs URL
-            if not data.get('url'):
-                return jsonify({'success': False, 'error': 'URL is required for HTTP monitors'})
-            params['url'] = data['url']
-            
-        elif monitor_type == 'keyword':
-            # Keyword monitor needs URL and keyword
-            if not data.get('url'):
-                return jsonify({'success': False, 'error': 'URL is required for Keyword monitors'})
-            if not data.get('keyword'):
-                return jsonify({'success': False, 'error': 'Keyword is required for Keyword monitors'})
-            params['url'] = data['url']
-            params['keyword'] = data['keyword']
-                
-        elif monitor_type == 'ping':
-            # Ping monitor needs hostname
-            if not data.get('hostname'):
-                return jsonify({'success': False, 'error': 'Hostname is required for Ping monitors'})
-            params['hostname'] = data['hostname']
+    service = get_uptime_kuma_service()
+    data = _json()
+    
+    if not data.get('name'):
+        return jsonify({'success': False, 'error': 'Name is required'})
+    
+    # Build the monitor parameters based on type
+    monitor_type = data.get('type', 'http')
+    params = {
+        'name': data['name'],
+        'monitor_type': monitor_type,
+        'interval': data.get('interval', 60)
+    }
+    
+    # Add type-specific parameters
+    if monitor_type == 'http':
+        # HTTP monitor needs URL
+        if not data.get('url'):
+            return jsonify({'success': False, 'error': 'URL is required for HTTP monitors'})
+        params['url'] = data['url']
+        
+    elif monitor_type == 'keyword':
+        # Keyword monitor needs URL and keyword
+        if not data.get('url'):
+            return jsonify({'success': False, 'error': 'URL is required for Keyword monitors'})
+        if not data.get('keyword'):
+            return jsonify({'success': False, 'error': 'Keyword is required for Keyword monitors'})
+        params['url'] = data['url']
+        params['keyword'] = data['keyword']
             
-        elif monitor_type == 'port':
-            # Port monitor needs hostname and port
-            if not data.get('hostname'):
-                return jsonify({'success': False, 'error': 'Hostname is required for Port monitors'})
-            if not data.get('port'):
-                return jsonify({'success': False, 'error': 'Port is required for Port monitors'})
-            params['hostname'] = data['hostname']
-            params['port'] = int(data['port'])
-        
-        # Call the service with the appropriate parameters
-        monitor = service.add_monitor(**params)
-        
-        return jsonify({'success': True, 'monitor': monitor})
-        
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except UptimeKumaException as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'})
+    elif monitor_type == 'ping':
+        # Ping monitor needs hostname
+        if not data.get('hostname'):
+            return jsonify({'success': False, 'error': 'Hostname is required for Ping monitors'})
+        params['hostname'] = data['hostname']
+        
+    elif monitor_type == 'port':
+        # Port monitor needs hostname and port
+        if not data.get('hostname'):
+            return jsonify({'success': False, 'error': 'Hostname is required for Port monitors'})
+        if not data.get('port'):
+            return jsonify({'success': False, 'error': 'Port is required for Port monitors'})
+        params['hostname'] = data['hostname']
+        params['port'] = _coerce_id(data['port'], 'port')
+    
+    # Call the service with the appropriate parameters
+    monitor = service.add_monitor(**params)
+    api_cache.invalidate(KUMA_MONITORS_KEY, KUMA_STATUS_PAGES_KEY)
+    
+    return jsonify({'success': True, 'monitor': monitor})
 
 
 @app.route('/api/uptime-kuma/monitor/edit', methods=['POST'])
+@api_handler({'success': False})
 def edit_uptime_kuma_monitor():
     """Edit an existing Uptime Kuma monitor."""
-    try:
-        service = get_uptime_kuma_service()
-        data = request.get_json()
-        
-        if not data.get('id'):
-            return jsonify({'success': False, 'error': 'Monitor ID is required'})
-        
-        monitor_id = int(data['id'])
-        update_data = {k: v for k, v in data.items() if k != 'id' and v is not None}
-        
-        service.edit_monitor(monitor_id, **update_data)
-        
-        return jsonify({'success': True})
-        
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except UptimeKumaException as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'})
+    service = get_uptime_kuma_service()
+    data = _json()
+    
+    if not data.get('id'):
+        return jsonify({'success': False, 'error': 'Monitor ID is required'})
+    
+    monitor_id = _coerce_id(data.pop('id'))
+    update_data = {k: v for k, v in data.items() if v is not None}
+    
+    service.edit_monitor(monitor_id, **update_data)
+    api_cache.invalidate(KUMA_MONITORS_KEY, KUMA_STATUS_PAGES_KEY)
+    
+    return jsonify({'success': True})
 
 
 @app.route('/api/uptime-kuma/monitor/delete', methods=['POST'])
+@api_handler({'success': False})
 def delete_uptime_kuma_monitor():
     """Delete an Uptime Kuma monitor."""
-    try:
-        service = get_uptime_kuma_service()
-        data = request.get_json()
-        
-        if not data.get('id'):
-            return jsonify({'success': False, 'error': 'Monitor ID is required'})
-        
-        service.delete_monitor(int(data['id']))
-        
-        return jsonify({'success': True})
-        
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except UptimeKumaException as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'})
+    service = get_uptime_kuma_service()
+    data = _json()
+    
+    if not data.get('id'):
+        return jsonify({'success': False, 'error': 'Monitor ID is required'})
+    
+    service.delete_monitor(_coerce_id(data['id']))
+    api_cache.invalidate(KUMA_MONITORS_KEY, KUMA_STATUS_PAGES_KEY)
+    
+    return jsonify({'success': True})
 
 
 # ==================== UPTIME KUMA STATUS PAGE ROUTES ====================
 
 @app.route('/api/uptime-kuma/status-pages')
+@api_handler({'status_pages': []})
 def api_uptime_kuma_status_pages():
     """Get all Uptime Kuma status pages."""
-    try:
-        service = get_uptime_kuma_service()
-        pages = service.get_status_pages()
-        return jsonify({'status_pages': pages})
-    except ValueError as e:
-        return jsonify({'error': str(e), 'status_pages': []})
-    except UptimeKumaException as e:
-        return jsonify({'error': str(e), 'status_pages': []})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'error': f'Unexpected error: {str(e)}', 'status_pages': []})
+    service = get_uptime_kuma_service()
+    pages = _kuma_status_pages(service)
+    return jsonify({'status_pages': pages})
 
 
 @app.route('/api/uptime-kuma/status-page/add', methods=['POST'])
+@api_handler({'success': False})
 def add_uptime_kuma_status_page():
     """Add a new Uptime Kuma status page."""
-    try:
-        service = get_uptime_kuma_service()
-        data = request.get_json()
-        
-        if not data.get('slug') or not data.get('title'):
-            return jsonify({'success': False, 'error': 'Slug and title are required'})
-        
-        page = service.add_status_page(
-            slug=data['slug'],
-            title=data['title'],
-            description=data.get('description', '')
-        )
-        
-        return jsonify({'success': True, 'page': page})
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except UptimeKumaException as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'})
+    service = get_uptime_kuma_service()
+    data = _json()
+    
+    if not data.get('slug') or not data.get('title'):
+        return jsonify({'success': False, 'error': 'Slug and title are required'})
+    
+    page = service.add_status_page(
+        slug=data['slug'],
+        title=data['title'],
+        description=data.get('description', '')
+    )
+    api_cache.invalidate(KUMA_STATUS_PAGES_KEY)
+    
+    return jsonify({'success': True, 'page': page})
 
 
 @app.route('/api/uptime-kuma/status-page/delete', methods=['POST'])
+@api_handler({'success': False})
 def delete_uptime_kuma_status_page():
     """Delete an Uptime Kuma status page."""
-    try:
-        service = get_uptime_kuma_service()
-        data = request.get_json()
-        
-        if not data.get('slug'):
-            return jsonify({'success': False, 'error': 'Status page slug is required'})
-        
-        service.delete_status_page(data['slug'])
-        return jsonify({'success': True})
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except UptimeKumaException as e:
-        return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'})
+    service = get_uptime_kuma_service()
+    data = _json()
+    
+    if not data.get('slug'):
+        return jsonify({'success': False, 'error': 'Status page slug is required'})
+    
+    service.delete_status_page(data['slug'])
+    api_cache.invalidate(KUMA_STATUS_PAGES_KEY)
+    return jsonify({'success': True})
 
 
 # ==================== UNIFIED STATUS PAGE API ====================
 
 @app.route('/api/unified/monitors')
 def get_all_monitors():
-    """Get monitors from both services combined."""
-    all_monitors = {
-        'uptime_robot': [],
-        'uptime_kuma': []
-    }
+    """
+    Get monitors from both services combined.
     
-    # Get Uptime Robot monitors
-    try:
-        service = get_uptime_robot_service()
-        all_monitors['uptime_robot'] = service.get_monitors()
-    except Exception as e:
-        logger.warning(f"Could not fetch Uptime Robot monitors: {e}")
+    Both services are queried in parallel and the response is streamed, so
+    each list is sent as soon as its service answers instead of waiting for
+    the slower one. A service that fails or times out is sent as [].
+    """
+    # Submit before streaming starts so the fetches run while headers go out
+    futures = {
+        upstream_executor.submit(
+            lambda: _robot_monitors(get_uptime_robot_service())): 'uptime_robot',
+        upstream_executor.submit(
+            lambda: _kuma_monitors(get_uptime_kuma_service())): 'uptime_kuma'
+    }
+    labels = {'uptime_robot': 'Uptime Robot', 'uptime_kuma': 'Uptime Kuma'}
     
-    # Get Uptime Kuma monitors
-    try:
-        service = get_uptime_kuma_service()
-        all_monitors['uptime_kuma'] = service.get_monitors()
-    except Exception as e:
-        logger.warning(f"Could not fetch Uptime Kuma monitors: {e}")
+    def generate():
+        pending = set(futures.values())
+        separator = '{'
+        
+        try:
+            for future in as_completed(futures, timeout=UPSTREAM_TIMEOUT):
+                key = futures[future]
+                pending.discard(key)
+                try:
+                    monitors = future.result()
+                except Exception as e:
+                    logger.warning("Could not fetch %s monitors: %s", labels[key], e)
+                    monitors = []
+                yield f'{separator}"{key}":{app.json.dumps(monitors)}'
+                separator = ','
+        except FutureTimeoutError:
+            logger.warning("Timed out fetching %s monitors",
+                           ', '.join(labels[key] for key in sorted(pending)))
+        
+        for key in sorted(pending):
+            yield f'{separator}"{key}":[]'
+            separator = ','
+        yield '}'
     
-    return jsonify(all_monitors)
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @app.route('/status-page-detail')
 def status_page_detail():
     """Status page detail page showing monitors on the status page."""
-    return render_template('status_page_detail.html')
+    return _render_page('status_page_detail.html')
 
 
 # ==================== UPTIME ROBOT STATUS PAGE DETAIL ROUTES ====================
 
 @app.route('/api/uptime-robot/status-page/<int:page_id>')
+@api_handler(error_status=500)
 def get_uptime_robot_status_page(page_id):
     """Get details of a specific Uptime Robot status page."""
-    try:
-        service = get_uptime_robot_service()
-        pages = service.get_status_pages()
-        
-        # Find the specific page
-        page = next((p for p in pages if p.get('id') == page_id), None)
+    service = get_uptime_robot_service()
+    page = _get_robot_status_page(service, page_id)
+    
+    if not page:
+        return jsonify({'error': 'Status page not found'}), 404
         
-        if not page:
-            return jsonify({'error': 'Status page not found'}), 404
-            
-        return jsonify({'status_page': page})
-    except Exception as e:
-        logger.error(f"Error getting status page: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'status_page': page})
 
 
 @app.route('/api/uptime-robot/status-page/<int:page_id>/monitors')
+@api_handler({'monitors': []}, error_status=500)
 def get_uptime_robot_status_page_monitors(page_id):
     """Get monitors on a specific Uptime Robot status page."""
-    try:
-        service = get_uptime_robot_service()
-        
-        # Get ALL monitors first
-        all_monitors = service.get_monitors()
-        
-        # Get the specific status page
-        pages = service.get_status_pages()
-        page = next((p for p in pages if p.get('id') == page_id), None)
-        
-        if not page:
-            return jsonify({'error': 'Status page not found', 'monitors': []}), 404
-        
-        # Get the monitor IDs that are on this status page
-        page_monitor_ids = [m.get('id') for m in page.get('monitors', [])]
-        
-        # Filter to only include monitors that are on this page
-        page_monitors = []
-        for monitor in all_monitors:
-            if monitor.get('id') in page_monitor_ids:
-                page_monitors.append(monitor)
-        
-        logger.info(f"Status page {page_id} has {len(page_monitors)} monitors (filtered from {len(all_monitors)} total)")
-        return jsonify({'monitors': page_monitors})
-        
-    except Exception as e:
-        logger.error(f"Error getting status page monitors: {e}")
-        return jsonify({'error': str(e), 'monitors': []}), 500
+    service = get_uptime_robot_service()
+    
+    # Fetch ALL monitors and the specific status page in parallel
+    monitors_future = upstream_executor.submit(_robot_monitors, service)
+    page = _get_robot_status_page(service, page_id)
+    all_monitors = monitors_future.result(timeout=UPSTREAM_TIMEOUT)
+    
+    if not page:
+        return jsonify({'error': 'Status page not found', 'monitors': []}), 404
+    
+    # Get the monitor IDs that are on this status page
+    page_monitor_ids = [m.get('id') for m in page.get('monitors', [])]
+    
+    # Filter to only include monitors that are on this page
+    page_monitors = []
+    for monitor in all_monitors:
+        if monitor.get('id') in page_monitor_ids:
+            page_monitors.append(monitor)
+    
+    logger.info("Status page %s has %d monitors (filtered from %d total)",
+                page_id, len(page_monitors), len(all_monitors))
+    return jsonify({'monitors': page_monitors})
 
 
 @app.route('/api/uptime-robot/status-page/<int:page_id>/add-monitors', methods=['POST'])
+@api_handler({'success': False})
 def add_monitors_to_uptime_robot_status_page(page_id):
     """Add monitors to an Uptime Robot status page."""
-    try:
-        service = get_uptime_robot_service()
-        data = request.get_json()
-        monitor_ids = data.get('monitor_ids', [])
-        
-        if not monitor_ids:
-            return jsonify({'success': False, 'error': 'No monitors specified'})
-        
-        # Get current page data
-        pages = service.get_status_pages()
-        page = next((p for p in pages if p.get('id') == page_id), None)
-        
-        if not page:
-            return jsonify({'success': False, 'error': 'Status page not found'})
-        
-        # Get current monitor IDs and add new ones
-        current_monitors = [m.get('id') for m in page.get('monitors', [])]
-        updated_monitors = list(set(current_monitors + monitor_ids))
-        
-        # Update the status page with new monitors
-        service.edit_status_page(page_id, monitors=updated_monitors)
-        
-        return jsonify({'success': True})
-    except Exception as e:
-        logger.error(f"Error adding monitors to status page: {e}")
-        return jsonify({'success': False, 'error': str(e)})
+    service = get_uptime_robot_service()
+    data = _json()
+    monitor_ids = data.get('monitor_ids', [])
+    
+    if not monitor_ids:
+        return jsonify({'success': False, 'error': 'No monitors specified'})
+    if not isinstance(monitor_ids, list):
+        raise _BadRequest('monitor_ids must be a list')
+    # Validate before any upstream call, so bad input is a 400 without a round trip
+    monitor_ids = [_coerce_id(m, 'monitor_ids') for m in monitor_ids]
+    
+    # Get current page data
+    page = _get_robot_status_page(service, page_id)
+    
+    if not page:
+        return jsonify({'success': False, 'error': 'Status page not found'})
+    
+    # Get current monitor IDs and add new ones
+    current_monitors = {m.get('id') for m in page.get('monitors', [])}
+    updated_monitors = list(current_monitors.union(monitor_ids))
+    
+    # Update the status page with new monitors
+    service.edit_status_page(page_id, monitors=updated_monitors)
+    api_cache.invalidate(ROBOT_STATUS_PAGES_KEY, _robot_status_page_key(page_id))
+    
+    return jsonify({'success': True})
 
 
 @app.route('/api/uptime-robot/status-page/<int:page_id>/remove-monitor', methods=['POST'])
+@api_handler({'success': False})
 def remove_monitor_from_uptime_robot_status_page(page_id):
     """Remove a monitor from an Uptime Robot status page."""
-    try:
-        service = get_uptime_robot_service()
-        data = request.get_json()
-        monitor_id = data.get('monitor_id')
-        
-        if not monitor_id:
-            return jsonify({'success': False, 'error': 'Monitor ID is required'})
-        
-        # Get current page data
-        pages = service.get_status_pages()
-        page = next((p for p in pages if p.get('id') == page_id), None)
-        
-        if not page:
-            return jsonify({'success': False, 'error': 'Status page not found'})
-        
-        # Remove the monitor
-        current_monitors = [m.get('id') for m in page.get('monitors', [])]
-        updated_monitors = [m for m in current_monitors if m != monitor_id]
-        
-        # Update the status page
-        service.edit_status_page(page_id, monitors=updated_monitors)
-        
-        return jsonify({'success': True})
-    except Exception as e:
-        logger.error(f"Error removing monitor from status page: {e}")
-        return jsonify({'success': False, 'error': str(e)})
+    service = get_uptime_robot_service()
+    data = _json()
+    monitor_id = data.get('monitor_id')
+    
+    if not monitor_id:
+        return jsonify({'success': False, 'error': 'Monitor ID is required'})
+    monitor_id = _coerce_id(monitor_id, 'monitor_id')
+    
+    # Get current page data
+    page = _get_robot_status_page(service, page_id)
+    
+    if not page:
+        return jsonify({'success': False, 'error': 'Status page not found'})
+    
+    # Remove the monitor
+    current_monitors = {m.get('id') for m in page.get('monitors', [])}
+    updated_monitors = list(current_monitors - {monitor_id})
+    
+    # Update the status page
+    service.edit_status_page(page_id, monitors=updated_monitors)
+    api_cache.invalidate(ROBOT_STATUS_PAGES_KEY, _robot_status_page_key(page_id))
+    
+    return jsonify({'success': True})
 
 
 # ==================== UPTIME KUMA STATUS PAGE DETAIL ROUTES ====================
 
 @app.route('/api/uptime-kuma/status-page/<slug>')
+@api_handler(error_status=500)
 def get_uptime_kuma_status_page(slug):
     """Get details of a specific Uptime Kuma status page."""
-    try:
-        service = get_uptime_kuma_service()
-        pages = service.get_status_pages()
-        
-        # Find the specific page
-        page = next((p for p in pages if p.get('slug') == slug), None)
+    service = get_uptime_kuma_service()
+    _, pages_by_slug = _kuma_status_pages_indexed(service)
+    page = pages_by_slug.get(slug)
+    
+    if not page:
+        return jsonify({'error': 'Status page not found'}), 404
         
-        if not page:
-            return jsonify({'error': 'Status page not found'}), 404
-            
-        return jsonify({'status_page': page})
-    except Exception as e:
-        logger.error(f"Error getting status page: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'status_page': page})
 
 
 @app.route('/api/uptime-kuma/status-page/<slug>/monitors')
+@api_handler({'monitors': []}, error_status=500)
 def get_uptime_kuma_status_page_monitors(slug):
     """Get monitors on a specific Uptime Kuma status page."""
-    try:
-        service = get_uptime_kuma_service()
-        
-        # Get the specific status page configuration
-        status_page = service.get_status_page(slug)
-        
-        if not status_page:
-            return jsonify({'error': 'Status page not found', 'monitors': []}), 404
-        
-        # Get monitor IDs/groups from the status page config
-        # Uptime Kuma stores this in publicGroupList
-        public_groups = status_page.get('publicGroupList', [])
-        
-        # Get all monitors
-        all_monitors = service.get_monitors()
-        
-        # Extract monitor IDs from the public groups
-        page_monitor_ids = []
-        for group in public_groups:
-            monitor_list = group.get('monitorList', [])
-            page_monitor_ids.extend([m.get('id') for m in monitor_list if m.get('id')])
-        
-        # Filter monitors to only those on this page
-        page_monitors = []
-        for monitor in all_monitors:
-            if monitor.get('id') in page_monitor_ids:
-                page_monitors.append(monitor)
-        
-        # If no specific monitors configured, return empty list
-        # (don't show all monitors by default)
-        logger.info(f"Status page '{slug}' has {len(page_monitors)} monitors (filtered from {len(all_monitors)} total)")
-        return jsonify({'monitors': page_monitors})
-        
-    except Exception as e:
-        logger.error(f"Error getting status page monitors: {e}")
-        return jsonify({'error': str(e), 'monitors': []}), 500
+    service = get_uptime_kuma_service()
+    
+    # Fetch all monitors while the status page configuration loads
+    monitors_future = upstream_executor.submit(_kuma_monitors, service)
+    
+    # Get the specific status page configuration, skipping the call for slugs
+    # the cached page list already rules out
+    status_page = None
+    cached = api_cache.get(KUMA_STATUS_PAGES_KEY)
+    if cached is None or slug in cached[1]:
+        try:
+            status_page = _kuma_cb.call(service.get_status_page, slug)
+        except UptimeKumaNotFoundException:
+            status_page = None
+    
+    if not status_page:
+        return jsonify({'error': 'Status page not found', 'monitors': []}), 404
+    
+    # Get monitor IDs/groups from the status page config
+    # Uptime Kuma stores this in publicGroupList
+    public_groups = status_page.get('publicGroupList', [])
+    
+    # Get all monitors
+    all_monitors = monitors_future.result(timeout=UPSTREAM_TIMEOUT)
+    
+    # Extract monitor IDs from the public groups
+    page_monitor_ids = []
+    for group in public_groups:
+        monitor_list = group.get('monitorList', [])
+        page_monitor_ids.extend([m.get('id') for m in monitor_list if m.get('id')])
+    
+    # Filter monitors to only those on this page
+    page_monitors = []
+    for monitor in all_monitors:
+        if monitor.get('id') in page_monitor_ids:
+            page_monitors.append(monitor)
+    
+    # If no specific monitors configured, return empty list
+    # (don't show all monitors by default)
+    logger.info("Status page '%s' has %d monitors (filtered from %d total)",
+                slug, len(page_monitors), len(all_monitors))
+    return jsonify({'monitors': page_monitors})
 
 
 @app.route('/api/uptime-kuma/status-page/<slug>/add-monitors', methods=['POST'])
+@api_handler({'success': False})
 def add_monitors_to_uptime_kuma_status_page(slug):
     """Add monitors to an Uptime Kuma status page."""
-    try:
-        # Note: This would need to be implemented based on Uptime Kuma's API
-        # For now, return success as Kuma status pages show all monitors by default
-        return jsonify({'success': True})
-    except Exception as e:
-        logger.error(f"Error adding monitors to status page: {e}")
-        return jsonify({'success': False, 'error': str(e)})
+    # Note: This would need to be implemented based on Uptime Kuma's API
+    # For now, return success as Kuma status pages show all monitors by default
+    return jsonify({'success': True})
 
 
 @app.route('/api/uptime-kuma/status-page/<slug>/remove-monitor', methods=['POST'])
+@api_handler({'success': False})
 def remove_monitor_from_uptime_kuma_status_page(slug):
     """Remove a monitor from an Uptime Kuma status page."""
-    try:
-        # Note: This would need to be implemented based on Uptime Kuma's API
-        return jsonify({'success': True})
-    except Exception as e:
-        logger.error(f"Error removing monitor from status page: {e}")
-        return jsonify({'success': False, 'error': str(e)})
+    # Note: This would need to be implemented based on Uptime Kuma's API
+    return jsonify({'success': True})
 
 
 # ==================== ERROR HANDLERS ====================
 
+@app.errorhandler(_BadRequest)
+def bad_request(error):
+    """Handle malformed request fields."""
+    return jsonify({'success': False, 'error': error.description}), 400
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
@@ -729,7 +956,7 @@ def not_found(error):
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    logger.error(f"Internal server error: {error}")
+    logger.error("Internal server error: %s", error)
     return jsonify({'error': 'Internal server error'}), 500
 
 
@@ -749,6 +976,7 @@ if __name__ == '__main__':
     print("=" * 60)
     print("📊 Dashboard will be available at: http://localhost:5000")
     print("📄 Status Pages Management: http://localhost:5000/status-pages")
+    print("⚠️  Development server - use 'gunicorn app:app' in production")
     print("=" * 60)
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    app.run(debug=FLASK_DEBUG, host=HOST, port=5000, threaded=True)
\ No newline at end of file
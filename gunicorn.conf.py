@@ -0,0 +1,25 @@
+"""
+Gunicorn Configuration
+======================
+
+Production server settings, picked up automatically by `gunicorn app:app`.
+
+The dashboard spends almost all of its time waiting on the Uptime Robot and
+Uptime Kuma APIs, so each worker runs a pool of threads (gthread) to keep
+serving requests while others are blocked on upstream I/O.
+
+The default bind address is loopback only, for running behind the nginx
+reverse proxy in deploy/nginx.conf. Set GUNICORN_BIND=0.0.0.0:5000 to expose
+gunicorn directly.
+
+Every setting can be overridden through the environment variables below.
+"""
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', '127.0.0.1:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', '4'))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '16'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+accesslog = '-'
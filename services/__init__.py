@@ -7,6 +7,8 @@ This package contains service modules for interacting with monitoring APIs.
 Modules:
     - uptime_robot: Uptime Robot API integration
     - uptime_kuma: Uptime Kuma API integration
+    - cache: In-process TTL cache for upstream responses
+    - circuit_breaker: Fail-fast protection for unavailable upstreams
 """
 
 from .uptime_robot import UptimeRobotService
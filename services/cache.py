@@ -0,0 +1,151 @@
+"""
+Cache Module
+============
+
+A small thread-safe in-process cache with per-entry expiry, used to avoid
+re-querying upstream APIs for data that was fetched moments ago.
+
+Classes:
+    TTLCache: Dictionary-like cache whose entries expire after a fixed time
+
+Usage:
+    cache = TTLCache(ttl=5)
+    monitors = cache.get_or_load('monitors', service.get_monitors)
+    cache.invalidate('monitors')
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+import threading
+import time
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe time-to-live cache.
+
+    Entries expire `ttl` seconds after they are stored. When more than
+    `maxsize` entries are held, the oldest entries are evicted first.
+
+    Attributes:
+        ttl (float): Lifetime of an entry in seconds
+        maxsize (int): Maximum number of entries kept
+
+    Example:
+        >>> cache = TTLCache(ttl=5, maxsize=64)
+        >>> cache.set('key', 'value')
+        >>> cache.get('key')
+        'value'
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Lifetime of an entry in seconds
+            maxsize: Maximum number of entries kept (default: 128)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        # Bumped by invalidate() and clear(), so loads that started before
+        # either one don't store their (possibly stale) result afterwards
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached value, or `default`
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime of this entry in seconds (default: the cache's ttl)
+        """
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        """Store a value; the caller must hold the lock."""
+        lifetime = self.ttl if ttl is None else ttl
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + lifetime, value)
+
+        while len(self._data) > self.maxsize:
+            del self._data[next(iter(self._data))]
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any],
+                    ttl: Union[float, Callable[[Any], float], None] = None) -> Any:
+        """
+        Get a cached value, calling `loader` to fill the entry on a miss.
+
+        The loader runs outside the cache lock, and exceptions it raises are
+        propagated without caching anything. If the cache is invalidated or
+        cleared while the loader runs, the value is returned but not stored.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value
+            ttl: Lifetime of a newly loaded entry (default: the cache's ttl),
+                or a callable computing it from the loaded value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            with self._lock:
+                generation = self._generation
+            value = loader()
+            if callable(ttl):
+                ttl = ttl(value)
+            with self._lock:
+                if generation == self._generation:
+                    self._store(key, value, ttl)
+        return value
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """
+        Remove entries from the cache.
+
+        Args:
+            *keys: Keys to remove (missing keys are ignored)
+        """
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
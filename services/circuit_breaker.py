@@ -0,0 +1,182 @@
+"""
+Circuit Breaker Module
+======================
+
+Fail-fast protection for calls to upstream services. After a number of
+consecutive failures the breaker "opens" and rejects calls immediately for a
+cool-down period instead of letting every request wait for a timeout.
+
+Classes:
+    CircuitBreaker: Tracks failures and short-circuits calls while open
+    CircuitOpenError: Raised when a call is rejected by an open breaker
+
+Usage:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, name="Uptime Kuma")
+    monitors = breaker.call(service.get_monitors)
+"""
+
+from typing import Any, Callable, Optional, Tuple, Type
+import logging
+import threading
+import time
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+    pass
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    States:
+        closed: Calls go through; failures are counted
+        open: Calls are rejected until `reset_timeout` has passed
+        half_open: One trial call goes through (others are rejected while it
+            runs); success closes the circuit, failure re-opens it
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit
+        reset_timeout (float): Seconds to stay open before a trial call
+        name (str): Label used in log and error messages
+        ignored_exceptions (tuple): Exceptions that don't count as failures
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+        >>> breaker.call(service.get_monitors)
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30,
+                 name: str = 'upstream',
+                 ignored_exceptions: Tuple[Type[BaseException], ...] = ()):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit (default: 3)
+            reset_timeout: Seconds to stay open before a trial call (default: 30)
+            name: Label used in log and error messages
+            ignored_exceptions: Exceptions that are re-raised without counting
+                as a failure (e.g. "not found" errors)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self.ignored_exceptions = ignored_exceptions
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._last_error: Optional[BaseException] = None
+        # Whether the half-open trial call is in flight
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half_open once the timeout passes."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        """Like `state`, for callers already holding the lock."""
+        if (self._state == self.OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout):
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may go through right now.
+
+        While half-open, only the first caller is allowed through as the trial
+        call; it must then report back with record_success or record_failure.
+
+        Returns:
+            bool: False while the circuit is open or a trial call is in flight
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.OPEN or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Circuit for %s closed", self.name)
+            self._state = self.CLOSED
+            self._failures = 0
+            self._last_error = None
+            self._probing = False
+
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        """
+        Record a failed call, opening the circuit once the threshold is reached.
+
+        Args:
+            error: The exception raised by the failed call (optional)
+        """
+        with self._lock:
+            self._failures += 1
+            self._last_error = error
+
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(
+                        "Circuit for %s opened after %d consecutive failures: %s",
+                        self.name, self._failures, error
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call `fn` through the breaker.
+
+        Args:
+            fn: Callable to invoke
+            *args, **kwargs: Arguments passed to `fn`
+
+        Returns:
+            Whatever `fn` returns
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            Exception: Anything raised by `fn`
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(
+                f"{self.name} is unavailable, retrying in at most "
+                f"{self.reset_timeout:.0f}s (last error: {self._last_error})"
+            )
+
+        try:
+            result = fn(*args, **kwargs)
+        except self.ignored_exceptions:
+            self.record_success()
+            raise
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        except BaseException:
+            # Interrupted without an outcome; let the next caller probe instead
+            with self._lock:
+                self._probing = False
+            raise
+
+        self.record_success()
+        return result
@@ -9,23 +9,76 @@ Classes:
     UptimeKumaService: Main service class for Uptime Kuma operations
 
 Usage:
-    service = UptimeKumaService(url="http://localhost:3001", username="admin", password="password")
-    monitors = service.get_monitors()
-    service.add_monitor(name="My Site", url="https://example.com")
+    with UptimeKumaService(url="http://localhost:3001", username="admin", password="password") as service:
+        monitors = service.get_monitors()
+        service.add_monitor(name="My Site", url="https://example.com")
 """
 
-from typing import Dict, List, Optional, Any
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple
+import atexit
 import logging
+import threading
+
+from .cache import TTLCache
+
+try:
+    import numpy as np
+except ImportError:  # optional: heartbeat stats fall back to pure Python
+    np = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Readable names for Uptime Kuma monitor types
+_MONITOR_TYPE_MAP = MappingProxyType({
+    'http': 'HTTP(s)',
+    'https': 'HTTP(s)',
+    'port': 'Port',
+    'ping': 'Ping',
+    'keyword': 'Keyword',
+    'dns': 'DNS',
+    'docker': 'Docker',
+    'push': 'Push',
+    'steam': 'Steam',
+    'gamedig': 'GameDig',
+    'mqtt': 'MQTT',
+    'sqlserver': 'SQL Server',
+    'postgres': 'PostgreSQL',
+    'mysql': 'MySQL',
+    'mongodb': 'MongoDB',
+    'radius': 'RADIUS'
+})
+
+# Monitor types that require a URL
+_HTTP_TYPES = frozenset({'http', 'https'})
+
+# Readable names already resolved, keyed by the raw type value from the API
+_monitor_type_names: Dict[str, str] = {}
+
+# Status text by status code (see UptimeKumaService.STATUS_*)
+_STATUS_TEXT = MappingProxyType({
+    0: 'Down',
+    1: 'Up',
+    2: 'Pending',
+    3: 'Maintenance'
+})
+
 
 class UptimeKumaException(Exception):
     """Custom exception for Uptime Kuma API errors"""
     pass
 
 
+class UptimeKumaNotFoundException(UptimeKumaException):
+    """Raised when a requested Uptime Kuma resource does not exist"""
+    pass
+
+
 class UptimeKumaService:
     """
     Service class for interacting with Uptime Kuma API.
@@ -33,11 +86,20 @@ class UptimeKumaService:
     This class provides methods for all CRUD operations on monitors,
     using the uptime-kuma-api library with enhanced data fetching.
     
+    The service is stateful: it logs in once and keeps the Socket.IO
+    connection open across calls and threads. Connections live in a
+    class-level pool keyed by account, so creating another service for the
+    same instance and user reuses the live connection instead of logging
+    in again. A background timer reconnects pooled connections whose
+    socket has dropped. Call close() (or use the service as a context
+    manager) to disconnect this account, or close_all() to drop the whole
+    pool; the pool is also closed at interpreter exit.
+    
     Attributes:
         url (str): Uptime Kuma instance URL
         username (str): Login username
         password (str): Login password
-        api: UptimeKumaApi instance (lazy loaded)
+        api: Pooled UptimeKumaApi connection (lazy loaded)
     
     Example:
         >>> service = UptimeKumaService(
@@ -55,7 +117,40 @@ class UptimeKumaService:
     STATUS_PENDING = 2
     STATUS_MAINTENANCE = 3
     
-    def __init__(self, url: str, username: str, password: str):
+    # Upper bound on parallel heartbeat requests
+    MAX_HEARTBEAT_WORKERS = 16
+    
+    # Hours of heartbeat history fetched per monitor (30 days, the longest window)
+    HEARTBEAT_HOURS = 720
+    
+    # Uptime windows reported per monitor, as (result key, hours)
+    UPTIME_WINDOWS = (('uptime_24h', 24), ('uptime_7d', 7 * 24), ('uptime_30d', 30 * 24))
+    
+    # Response times are averaged over the last day of heartbeats
+    RESPONSE_TIME_HOURS = 24
+    
+    # Number of most recent heartbeats returned as a monitor's 'logs'
+    LOG_SIZE = 20
+    
+    # Newest beats this many seconds in the future are put down to clock skew;
+    # beyond that the server timezone is assumed wrong (see _beats_ttl)
+    CLOCK_SKEW = 60
+    
+    # Below this many heartbeats, NumPy's setup costs more than it saves
+    NUMPY_MIN_HEARTBEATS = 64
+    
+    # Seconds between checks of pooled connections
+    REAPER_INTERVAL = 60
+    
+    # Logged-in connections shared by all instances, keyed by (url, username, password)
+    _pool: Dict[Tuple[str, str, str], Any] = {}
+    _pool_lock = threading.Lock()
+    # Per-account locks held while logging in, so a slow login never blocks
+    # _pool_lock (and with it every other account's lookups)
+    _login_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+    _reaper: Optional[threading.Timer] = None
+    
+    def __init__(self, url: str, username: str, password: str, heartbeat_ttl: float = 5.0):
         """
         Initialize the Uptime Kuma service.
         
@@ -63,6 +158,9 @@ class UptimeKumaService:
             url: Uptime Kuma instance URL (e.g., "http://localhost:3001")
             username: Login username
             password: Login password
+            heartbeat_ttl: Minimum seconds to reuse fetched heartbeats (default: 5);
+                they are reused for longer when the monitor's next check is
+                further away than that
         
         Raises:
             ValueError: If any required parameter is missing
@@ -73,13 +171,43 @@ class UptimeKumaService:
         self.url = url.rstrip('/')
         self.username = username
         self.password = password
-        self._api = None
-        
-        logger.info(f"UptimeKumaService initialized for {self.url}")
+        # Connections come from the class-level pool (see _get_api)
+        self._pool_key = (self.url, self.username, self.password)
+        self._lock = threading.Lock()
+        # Long-lived worker pool for heartbeat requests (created on first use)
+        self._executor = None
+        # Recent heartbeats keyed by (monitor_id, hours)
+        self.heartbeat_ttl = heartbeat_ttl
+        self._beats_cache = TTLCache(ttl=heartbeat_ttl, maxsize=1024)
+        # Seconds between checks per monitor, learned from monitor data
+        self._check_intervals: Dict[int, float] = {}
+        # (api, tzinfo) for the connection the server timezone was read from
+        self._server_tz = (None, None)
+        # Whether the API returns heartbeats oldest first (checked on first fetch)
+        self._beats_ascending = None
+        
+        logger.info("UptimeKumaService initialized for %s", self.url)
+    
+    def __enter__(self):
+        self._get_api()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @property
+    def _api(self):
+        """Pooled connection for this account, if one is open."""
+        return self._pool.get(self._pool_key)
     
     def _get_api(self):
         """
-        Get or create API instance.
+        Get the pooled API connection for this account, logging in on first use.
+        
+        The connection stays open between calls and is shared with other
+        instances for the same account. If its socket has dropped, a new
+        connection is made and logged in again (see _login for why a dropped
+        socket never comes back by itself).
         
         Returns:
             UptimeKumaApi: Connected API instance
@@ -87,19 +215,74 @@ class UptimeKumaService:
         Raises:
             UptimeKumaException: If connection or login fails
         """
-        if self._api is not None:
-            return self._api
+        api = self._api
+        if api is not None and api.sio.connected:
+            return api
+        return self._connect(self._pool_key)
+    
+    @classmethod
+    def _connect(cls, key: Tuple[str, str, str]):
+        """
+        Get a connected API for an account, replacing a dropped connection.
+        
+        Logging in happens under the account's login lock only, with
+        _pool_lock held just for the pool lookups and updates around it.
+        
+        Args:
+            key: (url, username, password) of the account
         
+        Returns:
+            UptimeKumaApi: Connected API instance
+        
+        Raises:
+            UptimeKumaException: If connection or login fails
+        """
+        with cls._pool_lock:
+            login_lock = cls._login_locks.setdefault(key, threading.Lock())
+        
+        with login_lock:
+            with cls._pool_lock:
+                # Another thread may have connected while we waited
+                api = cls._pool.get(key)
+                if api is not None and api.sio.connected:
+                    return api
+                stale = cls._pool.pop(key, None)
+            
+            if stale is not None:
+                logger.warning("Uptime Kuma connection to %s lost, reconnecting", key[0])
+                cls._close_api(stale)
+            
+            api = cls._login(*key)
+            with cls._pool_lock:
+                cls._pool[key] = api
+                cls._schedule_reaper()
+            return api
+    
+    @staticmethod
+    def _login(url: str, username: str, password: str):
+        """
+        Open a new API connection and log in.
+        
+        Returns:
+            UptimeKumaApi: Connected API instance
+        
+        Raises:
+            UptimeKumaException: If connection or login fails
+        """
         try:
             from uptime_kuma_api import UptimeKumaApi
             
-            logger.debug(f"Connecting to Uptime Kuma at {self.url}")
-            api = UptimeKumaApi(self.url)
-            api.login(self.username, self.password)
+            logger.debug("Connecting to Uptime Kuma at %s", url)
+            api = UptimeKumaApi(url)
+            api.login(username, password)
+            # socketio reconnects on its own after a drop but doesn't log in
+            # again, leaving a connected yet unauthenticated socket. Without
+            # auto-reconnect a drop leaves sio.connected False, and the next
+            # _get_api makes a fresh, logged-in connection instead.
+            api.sio.reconnection = False
             
-            self._api = api
             logger.info("Successfully connected to Uptime Kuma")
-            return self._api
+            return api
             
         except ImportError:
             raise UptimeKumaException(
@@ -115,26 +298,82 @@ class UptimeKumaService:
                 )
             elif 'connect' in error_msg or 'connection' in error_msg:
                 raise UptimeKumaException(
-                    f"Cannot connect to {self.url} - Check URL and ensure Uptime Kuma is running: {e}"
+                    f"Cannot connect to {url} - Check URL and ensure Uptime Kuma is running: {e}"
                 )
             else:
                 raise UptimeKumaException(f"Failed to initialize API: {e}")
     
-    def _disconnect(self):
-        """Disconnect from API if connected."""
-        if self._api is not None:
+    @staticmethod
+    def _close_api(api):
+        """Disconnect an API connection, logging (not raising) errors."""
+        try:
+            api.disconnect()
+            logger.debug("Disconnected from Uptime Kuma")
+        except Exception as e:
+            logger.warning("Error during disconnect: %s", e)
+    
+    @classmethod
+    def _schedule_reaper(cls):
+        """Start the connection check timer if it isn't running. Call with _pool_lock held."""
+        if cls._reaper is None and cls._pool:
+            cls._reaper = threading.Timer(cls.REAPER_INTERVAL, cls._reap)
+            cls._reaper.daemon = True
+            cls._reaper.start()
+    
+    @classmethod
+    def _reap(cls):
+        """Reconnect pooled connections whose socket has dropped, then reschedule."""
+        with cls._pool_lock:
+            cls._reaper = None
+            dropped = [key for key, api in cls._pool.items() if not api.sio.connected]
+        
+        # Reconnect outside _pool_lock; a failed login leaves the account out
+        # of the pool until its next call
+        for key in dropped:
             try:
-                self._api.disconnect()
-                logger.debug("Disconnected from Uptime Kuma")
-            except Exception as e:
-                logger.warning(f"Error during disconnect: {e}")
-            finally:
-                self._api = None
+                cls._connect(key)
+            except UptimeKumaException as e:
+                logger.warning("Could not reconnect to %s: %s", key[0], e)
+        
+        with cls._pool_lock:
+            cls._schedule_reaper()
+    
+    @classmethod
+    def close_all(cls):
+        """Disconnect every pooled connection and stop the connection checks."""
+        with cls._pool_lock:
+            if cls._reaper is not None:
+                cls._reaper.cancel()
+                cls._reaper = None
+            for api in cls._pool.values():
+                cls._close_api(api)
+            cls._pool.clear()
+    
+    def close(self):
+        """
+        Close this account's pooled connection and this instance's worker pool.
+        
+        Other instances for the same account reconnect on their next call.
+        """
+        with self._pool_lock:
+            api = self._pool.pop(self._pool_key, None)
+            if api is not None:
+                self._close_api(api)
+        
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
     
-    def get_monitors(self) -> List[Dict[str, Any]]:
+    def get_monitors(self, parallel: bool = True) -> List[Dict[str, Any]]:
         """
         Fetch all monitors from Uptime Kuma with detailed metrics.
         
+        Args:
+            parallel: Send all heartbeat requests before waiting for any reply
+                (default: True). When False, or when the client doesn't allow
+                raw emits, requests are spread over a worker pool instead.
+        
         Returns:
             list: List of monitor dictionaries with standardized fields
         
@@ -146,37 +385,251 @@ class UptimeKumaService:
             >>> for monitor in monitors:
             ...     print(f"{monitor['name']}: {monitor['status']}")
         """
-        api = None
         try:
             api = self._get_api()
             monitors_data = api.get_monitors()
             
+            # Fetch heartbeats for more accurate status and metrics
+            ids = [m['id'] for m in monitors_data if m.get('id')]
+            for monitor in monitors_data:
+                self._remember_interval(monitor)
+            beats_by_id = self._fetch_heartbeats(api, ids, parallel=parallel)
+            
             monitors = []
             for monitor in monitors_data:
-                # Get detailed data for each monitor
-                try:
-                    monitor_id = monitor.get('id')
-                    if monitor_id:
-                        # Fetch heartbeats for more accurate status and metrics
-                        heartbeats = api.get_monitor_beats(monitor_id, hours=24)
-                        monitor['_heartbeats'] = heartbeats
-                except Exception as e:
-                    logger.warning(f"Could not fetch heartbeats for monitor {monitor.get('id')}: {e}")
-                    monitor['_heartbeats'] = []
-                
+                monitor['_heartbeats'] = beats_by_id.get(monitor.get('id'), [])
                 monitors.append(self._format_monitor(monitor))
             
-            logger.info(f"Retrieved {len(monitors)} monitors with detailed metrics")
+            logger.info("Retrieved %d monitors with detailed metrics", len(monitors))
             return monitors
             
         except UptimeKumaException:
             raise
         except Exception as e:
-            logger.error(f"Failed to get monitors: {e}")
+            logger.error("Failed to get monitors: %s", e)
             raise UptimeKumaException(f"Failed to get monitors: {e}")
-        finally:
-            if api:
-                self._disconnect()
+    
+    def cache_clear(self):
+        """Drop all cached heartbeats."""
+        self._beats_cache.clear()
+    
+    def invalidate(self, monitor_id: int):
+        """
+        Drop cached heartbeats for one monitor.
+        
+        Called after the monitor is edited, deleted, paused or resumed.
+        
+        Args:
+            monitor_id: ID of the monitor
+        """
+        self._beats_cache.invalidate((monitor_id, self.HEARTBEAT_HOURS))
+        self._check_intervals.pop(monitor_id, None)
+    
+    def _remember_interval(self, monitor: Dict[str, Any]):
+        """Record how often a monitor checks, using the shorter of interval and retryInterval."""
+        intervals = [value for value in (monitor.get('interval'), monitor.get('retryInterval'))
+                     if isinstance(value, (int, float)) and value > 0]
+        if monitor.get('id') and intervals:
+            self._check_intervals[monitor['id']] = min(intervals)
+    
+    def _server_timezone(self, api) -> Optional[timezone]:
+        """
+        Timezone of the beat times the server reports, from its serverTimezoneOffset.
+        
+        Returns:
+            timezone: Fixed offset (e.g. +02:00), or None if the server doesn't say
+        """
+        cached_api, tz = self._server_tz
+        if cached_api is api:
+            return tz
+        
+        tz = None
+        try:
+            offset = api.info().get('serverTimezoneOffset') or ''
+            sign = -1 if offset.startswith('-') else 1
+            hours, minutes = offset.lstrip('+-').split(':')
+            tz = timezone(sign * timedelta(hours=int(hours), minutes=int(minutes)))
+        except Exception as e:
+            logger.debug("Server timezone unavailable: %s", e)
+        self._server_tz = (api, tz)
+        return tz
+    
+    def _beats_ttl(self, api, monitor_id: int, beats: List[Dict[str, Any]]) -> float:
+        """
+        How long a monitor's fetched heartbeats stay fresh.
+        
+        Uptime Kuma can't record a new beat before the newest one plus the
+        check interval, so heartbeats are reused until then, but never for
+        less than heartbeat_ttl. Only heartbeat_ttl applies when the
+        interval, the newest beat time or the server timezone is unknown, or
+        the newest beat appears to be in the future.
+        """
+        interval = self._check_intervals.get(monitor_id)
+        tz = self._server_timezone(api)
+        if not interval or not beats or tz is None:
+            return self.heartbeat_ttl
+        
+        # Either end may be newest, depending on the order the API returns
+        newest = max(beats[0].get('time') or '', beats[-1].get('time') or '')
+        try:
+            newest_at = datetime.fromisoformat(newest).replace(tzinfo=tz)
+        except ValueError:
+            return self.heartbeat_ttl
+        
+        age = (datetime.now(timezone.utc) - newest_at).total_seconds()
+        if age < -self.CLOCK_SKEW:
+            return self.heartbeat_ttl
+        return max(self.heartbeat_ttl, interval - max(age, 0.0))
+    
+    def _get_beats(self, api, monitor_id: int, hours: int = HEARTBEAT_HOURS) -> List[Dict[str, Any]]:
+        """
+        Get a monitor's heartbeats, reusing results that are still fresh (see _beats_ttl).
+        
+        Args:
+            api: Connected UptimeKumaApi instance
+            monitor_id: ID of the monitor
+            hours: How many hours of history to fetch
+        
+        Returns:
+            list: Heartbeat records
+        """
+        return self._beats_cache.get_or_load(
+            (monitor_id, hours), lambda: api.get_monitor_beats(monitor_id, hours=hours),
+            ttl=lambda beats: self._beats_ttl(api, monitor_id, beats))
+    
+    def _check_beat_order(self, beat_lists):
+        """
+        Record whether heartbeats come back in ascending time order.
+        
+        Args:
+            beat_lists: Heartbeat lists to inspect; the first with two or more
+                entries decides
+        """
+        for beats in beat_lists:
+            if len(beats) >= 2:
+                self._beats_ascending = beats[0].get('time', '') <= beats[-1].get('time', '')
+                logger.debug("Heartbeats are returned in %s order",
+                             'ascending' if self._beats_ascending else 'descending')
+                return
+    
+    def _fetch_heartbeats(self, api, monitor_ids: List[int], hours: int = HEARTBEAT_HOURS,
+                          parallel: bool = True) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Fetch heartbeats for several monitors at once.
+        
+        Cached heartbeats are returned directly. The rest are pipelined on the
+        socket (see _pipeline_heartbeats), or requested together from the
+        service's worker pool when that isn't possible. Either way total
+        time is about one round-trip rather than one per monitor.
+        
+        Args:
+            api: Connected UptimeKumaApi instance
+            monitor_ids: IDs of the monitors to fetch heartbeats for
+            hours: How many hours of history to fetch
+            parallel: Try pipelining before falling back to the worker pool
+        
+        Returns:
+            dict: Heartbeat lists keyed by monitor ID (empty list on failure)
+        """
+        def fetch(monitor_id):
+            try:
+                return monitor_id, self._get_beats(api, monitor_id, hours)
+            except Exception as e:
+                logger.warning("Could not fetch heartbeats for monitor %s: %s", monitor_id, e)
+                return monitor_id, []
+        
+        beats_by_id = {}
+        missing = []
+        for monitor_id in monitor_ids:
+            beats = self._beats_cache.get((monitor_id, hours))
+            if beats is None:
+                missing.append(monitor_id)
+            else:
+                beats_by_id[monitor_id] = beats
+        
+        if len(missing) == 1:
+            beats_by_id.update([fetch(missing[0])])
+        elif missing:
+            fetched = self._pipeline_heartbeats(api, missing, hours) if parallel else None
+            if fetched is None:
+                fetched = self._get_executor().map(fetch, missing)
+            beats_by_id.update(fetched)
+        
+        return beats_by_id
+    
+    def _pipeline_heartbeats(self, api, monitor_ids: List[int],
+                             hours: int) -> Optional[Dict[int, List[Dict[str, Any]]]]:
+        """
+        Emit every getMonitorBeats request before waiting for any acknowledgement.
+        
+        Works on the client's underlying Socket.IO connection. Each reply is
+        handled by its own callback, and one Event is set when the last one
+        arrives. Replies get the same post-processing as
+        UptimeKumaApi.get_monitor_beats.
+        
+        Args:
+            api: Connected UptimeKumaApi instance
+            monitor_ids: IDs of the monitors to fetch heartbeats for
+            hours: How many hours of history to fetch
+        
+        Returns:
+            dict: Heartbeat lists keyed by monitor ID (empty list on failure),
+                or None if the client doesn't support raw emits
+        """
+        try:
+            from uptime_kuma_api.api import int_to_bool, parse_monitor_status
+            emit = api.sio.emit
+        except (ImportError, AttributeError):
+            return None
+        
+        replies = {}
+        replies_lock = threading.Lock()
+        all_replied = threading.Event()
+        
+        def on_reply(monitor_id):
+            def callback(*args):
+                with replies_lock:
+                    replies[monitor_id] = args[0] if args else None
+                    if len(replies) == len(monitor_ids):
+                        all_replied.set()
+            return callback
+        
+        for monitor_id in monitor_ids:
+            emit('getMonitorBeats', (monitor_id, hours), callback=on_reply(monitor_id))
+        all_replied.wait(getattr(api, 'timeout', 10))
+        
+        beats_by_id = {}
+        with replies_lock:
+            received = dict(replies)
+        for monitor_id in monitor_ids:
+            try:
+                if monitor_id not in received:
+                    raise UptimeKumaException("Timed out waiting for heartbeats")
+                reply = received[monitor_id]
+                if isinstance(reply, dict) and not reply.get('ok', True):
+                    raise UptimeKumaException(reply.get('msg'))
+                beats = reply['data']
+                int_to_bool(beats, ['important'])
+                parse_monitor_status(beats)
+                self._beats_cache.set((monitor_id, hours), beats,
+                                      ttl=self._beats_ttl(api, monitor_id, beats))
+                beats_by_id[monitor_id] = beats
+            except Exception as e:
+                logger.warning("Could not fetch heartbeats for monitor %s: %s", monitor_id, e)
+                beats_by_id[monitor_id] = []
+        
+        return beats_by_id
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool used for parallel heartbeat requests, creating it on first use."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.MAX_HEARTBEAT_WORKERS,
+                        thread_name_prefix='kuma-beats'
+                    )
+        return self._executor
     
     def _format_monitor(self, monitor: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -190,37 +643,31 @@ class UptimeKumaService:
         """
         monitor_name = monitor.get('name', 'Unknown')
         
-        # Extract heartbeats
-        heartbeats = monitor.get('_heartbeats', [])
+        # Extract heartbeats (the raw monitor dict doesn't keep them)
+        heartbeats = monitor.pop('_heartbeats', [])
         
         # Log heartbeat data for debugging
         if heartbeats:
-            logger.debug(f"Monitor '{monitor_name}': {len(heartbeats)} heartbeats fetched")
-            recent_statuses = [beat.get('status') for beat in heartbeats[:5]]
-            logger.debug(f"Monitor '{monitor_name}': Recent heartbeat statuses: {recent_statuses}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Monitor '%s': %d heartbeats fetched", monitor_name, len(heartbeats))
+                recent_statuses = [beat.get('status') for beat in heartbeats[-5:]]
+                logger.debug("Monitor '%s': Recent heartbeat statuses: %s", monitor_name, recent_statuses)
         else:
-            logger.warning(f"Monitor '{monitor_name}': No heartbeats available")
+            logger.warning("Monitor '%s': No heartbeats available", monitor_name)
         
-        # Calculate uptime from heartbeats if available
-        uptime_24h = self._calculate_uptime_from_heartbeats(heartbeats)
-        uptime_30d = uptime_24h  # Use same for now, could fetch 30d separately
+        # Calculate uptime and response times from heartbeats if available
+        stats = self._summarize_heartbeats(heartbeats)
+        uptime_24h = stats['uptime_24h']
+        uptime_7d = stats['uptime_7d']
+        uptime_30d = stats['uptime_30d']
+        avg_response_time = stats['avg_response_time']
+        current_response_time = stats['response_time']
         
-        # Get response time data
-        avg_response_time = 'N/A'
-        current_response_time = 'N/A'
+        # Determine actual status from the most recent heartbeat
+        is_up = self._determine_status_from_heartbeats(monitor, stats['last_status'])
         
-        # Get average ping from heartbeats
-        if heartbeats:
-            ping_values = [beat.get('ping', 0) for beat in heartbeats if beat.get('ping') is not None and beat.get('ping') > 0]
-            if ping_values:
-                avg_response_time = f"{sum(ping_values) / len(ping_values):.0f}"
-                current_response_time = f"{ping_values[-1]:.0f}"  # Most recent
-        
-        # Determine actual status from heartbeats
-        is_up = self._determine_status_from_heartbeats(monitor, heartbeats)
-        
-        logger.info(f"Monitor '{monitor_name}': Determined status = {'UP' if is_up else 'DOWN'}, "
-                   f"Uptime = {uptime_24h}%, Avg Response = {avg_response_time}ms")
+        logger.debug("Monitor '%s': Determined status = %s, Uptime = %s%%, Avg Response = %sms",
+                     monitor_name, 'UP' if is_up else 'DOWN', uptime_24h, avg_response_time)
         
         # Get monitor type
         monitor_type = self._get_monitor_type(monitor.get('type'))
@@ -232,7 +679,7 @@ class UptimeKumaService:
             'status': is_up,  # True = UP, False = DOWN
             'uptime': uptime_24h,  # Overall uptime
             'uptime_24h': uptime_24h,  # 24-hour uptime
-            'uptime_7d': uptime_24h,    # 7-day uptime (using 24h as approximation)
+            'uptime_7d': uptime_7d,    # 7-day uptime
             'uptime_30d': uptime_30d,  # 30-day uptime
             'response_time': current_response_time,  # Current response time
             'avg_response_time': avg_response_time,  # Average response time
@@ -240,82 +687,158 @@ class UptimeKumaService:
             'active': monitor.get('active', True),  # Monitor enabled/disabled
             'interval': monitor.get('interval', 60),
             'custom_uptime_ratio': uptime_24h,  # For compatibility
-            'custom_uptime_ranges': [uptime_24h, uptime_24h, uptime_30d],
-            'logs': heartbeats[:20] if heartbeats else []  # Last 20 checks
+            'custom_uptime_ranges': [uptime_24h, uptime_7d, uptime_30d],
+            'logs': stats['logs']  # Last 20 checks
         }
     
-    def _calculate_uptime_from_heartbeats(self, heartbeats: List[Dict[str, Any]]) -> str:
+    @staticmethod
+    def _window_threshold(latest: datetime, hours: int) -> str:
         """
-        Calculate uptime percentage from heartbeat data.
+        Get the time string at which a window of `hours` ending at `latest` starts.
+        
+        Heartbeat times are "YYYY-MM-DD HH:MM:SS.fff" strings, which sort
+        in time order, so they can be compared with the result directly.
+        """
+        return (latest - timedelta(hours=hours)).strftime('%Y-%m-%d %H:%M:%S')
+    
+    def _summarize_heartbeats(self, heartbeats: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Calculate per-window uptime, response times and the latest status from heartbeats.
+        
+        Windows end at the newest heartbeat. Everything is gathered in one
+        pass over the heartbeats, keeping only the last LOG_SIZE beats. Long
+        lists use NumPy instead when it is installed: up-counts become a
+        running total, and each window's uptime is a subtraction at the
+        index where the window starts.
         
         Args:
             heartbeats: List of heartbeat records
         
         Returns:
-            str: Uptime percentage as string (e.g., "99.5")
+            dict: 'uptime_24h', 'uptime_7d', 'uptime_30d' percentages and
+                'avg_response_time', 'response_time' pings as strings
+                (e.g. "99.50", "120"), with 'N/A' for missing values, plus
+                'last_status' (status of the newest beat, or None) and
+                'logs' (the newest LOG_SIZE beats)
         """
+        stats = {name: 'N/A' for name, _ in self.UPTIME_WINDOWS}
+        stats['avg_response_time'] = 'N/A'
+        stats['response_time'] = 'N/A'
+        stats['last_status'] = None
+        stats['logs'] = []
+        
         if not heartbeats:
-            return 'N/A'
+            return stats
         
         try:
-            # Count successful checks (status == 1)
-            total_checks = len(heartbeats)
-            successful_checks = sum(1 for beat in heartbeats if beat.get('status') == 1)
+            # Heartbeats come back in time order, so newest-first lists only
+            # need reversing; the last beat is then always the newest
+            if self._beats_ascending is None:
+                self._check_beat_order([heartbeats])
+            if self._beats_ascending is False:
+                heartbeats = heartbeats[::-1]
             
-            if total_checks == 0:
-                return 'N/A'
+            latest = datetime.fromisoformat(heartbeats[-1].get('time', ''))
+            thresholds = [self._window_threshold(latest, hours) for _, hours in self.UPTIME_WINDOWS]
+            ping_threshold = self._window_threshold(latest, self.RESPONSE_TIME_HOURS)
+            total = len(heartbeats)
             
-            uptime_percentage = (successful_checks / total_checks) * 100
-            return f"{uptime_percentage:.2f}"
+            if np is not None and total >= self.NUMPY_MIN_HEARTBEATS:
+                times = [beat.get('time', '') for beat in heartbeats]
+                up = np.fromiter((beat.get('status') == 1 for beat in heartbeats),
+                                 dtype=bool, count=total)
+                up_before = np.concatenate(([0], np.cumsum(up)))
+                ping_start = bisect_left(times, ping_threshold)
+                pings = np.fromiter((beat.get('ping') or 0 for beat in heartbeats[ping_start:]),
+                                    dtype=np.float64, count=total - ping_start)
+                ping_values = pings[pings > 0]
+                
+                window_counts = []
+                for threshold in thresholds:
+                    start = bisect_left(times, threshold)
+                    window_counts.append((total - start, int(up_before[total] - up_before[start])))
+                ping_count = int(ping_values.size)
+                ping_sum = float(ping_values.sum())
+                last_ping = float(ping_values[-1]) if ping_count else None
+                tail = heartbeats[-self.LOG_SIZE:]
+            else:
+                checks = [0] * len(thresholds)
+                successes = [0] * len(thresholds)
+                ping_sum = 0
+                ping_count = 0
+                last_ping = None
+                tail = deque(maxlen=self.LOG_SIZE)
+                
+                for beat in heartbeats:
+                    beat_time = beat.get('time', '')
+                    is_up = beat.get('status') == 1
+                    for i, threshold in enumerate(thresholds):
+                        if beat_time >= threshold:
+                            checks[i] += 1
+                            successes[i] += is_up
+                    if beat_time >= ping_threshold:
+                        ping = beat.get('ping') or 0
+                        if ping > 0:
+                            ping_sum += ping
+                            ping_count += 1
+                            last_ping = ping
+                    tail.append(beat)
+                
+                window_counts = list(zip(checks, successes))
+                tail = list(tail)
+            
+            stats['last_status'] = heartbeats[-1].get('status')
+            stats['logs'] = tail
+            
+            for (name, _), (checks_in_window, successful_checks) in zip(self.UPTIME_WINDOWS, window_counts):
+                stats[name] = f"{successful_checks / checks_in_window * 100:.2f}"
+            
+            if ping_count:
+                stats['avg_response_time'] = f"{ping_sum / ping_count:.0f}"
+                stats['response_time'] = f"{last_ping:.0f}"  # Most recent
             
         except Exception as e:
-            logger.warning(f"Error calculating uptime: {e}")
-            return 'N/A'
+            logger.warning("Error calculating heartbeat stats: %s", e)
+        
+        return stats
     
-    def _determine_status_from_heartbeats(self, monitor: Dict[str, Any], heartbeats: List[Dict[str, Any]]) -> bool:
+    def _determine_status_from_heartbeats(self, monitor: Dict[str, Any], last_status: Any) -> bool:
         """
         Determine the actual UP/DOWN status from monitor data and heartbeats.
         
         Args:
             monitor: Monitor data dictionary
-            heartbeats: List of recent heartbeat records
+            last_status: Status of the most recent heartbeat (None if there are none)
         
         Returns:
             bool: True if UP, False if DOWN
         """
         # First check if monitor is active
         if not monitor.get('active', True):
-            logger.debug(f"Monitor {monitor.get('name')}: inactive")
+            logger.debug("Monitor %s: inactive", monitor.get('name'))
             return False
         
         # Check most recent heartbeat
-        if heartbeats:
-            # Get the most recent heartbeat
-            recent_beats = sorted(heartbeats, key=lambda x: x.get('time', 0), reverse=True)
-            if recent_beats:
-                most_recent = recent_beats[0]
-                status = most_recent.get('status')
-                
-                # Status: 0 = DOWN, 1 = UP, 2 = PENDING
-                if status == 1:
-                    logger.debug(f"Monitor {monitor.get('name')}: UP (from recent heartbeat)")
-                    return True
-                elif status == 0:
-                    logger.debug(f"Monitor {monitor.get('name')}: DOWN (from recent heartbeat)")
-                    return False
-                elif status == 2:
-                    logger.debug(f"Monitor {monitor.get('name')}: PENDING (from recent heartbeat)")
-                    return False  # Treat PENDING as DOWN for safety
+        # Status: 0 = DOWN, 1 = UP, 2 = PENDING
+        if last_status == 1:
+            logger.debug("Monitor %s: UP (from recent heartbeat)", monitor.get('name'))
+            return True
+        elif last_status == 0:
+            logger.debug("Monitor %s: DOWN (from recent heartbeat)", monitor.get('name'))
+            return False
+        elif last_status == 2:
+            logger.debug("Monitor %s: PENDING (from recent heartbeat)", monitor.get('name'))
+            return False  # Treat PENDING as DOWN for safety
         
         # Fallback to monitor's status field
         if 'status' in monitor and monitor['status'] is not None:
             status_code = monitor['status']
-            logger.debug(f"Monitor {monitor.get('name')}: status field = {status_code}")
+            logger.debug("Monitor %s: status field = %s", monitor.get('name'), status_code)
             return status_code == self.STATUS_UP
         
         # CRITICAL FIX: If we can't determine status and have no heartbeats, assume DOWN
         # This prevents showing monitors as UP when they're actually unreachable
-        logger.warning(f"Monitor {monitor.get('name')}: Unable to determine status from heartbeats or status field, defaulting to DOWN")
+        logger.warning("Monitor %s: Unable to determine status from heartbeats or status field, defaulting to DOWN", monitor.get('name'))
         return False
     
     def _get_monitor_type(self, type_value: Any) -> str:
@@ -328,27 +851,12 @@ class UptimeKumaService:
         Returns:
             str: Human-readable type name
         """
-        type_map = {
-            'http': 'HTTP(s)',
-            'https': 'HTTP(s)',
-            'port': 'Port',
-            'ping': 'Ping',
-            'keyword': 'Keyword',
-            'dns': 'DNS',
-            'docker': 'Docker',
-            'push': 'Push',
-            'steam': 'Steam',
-            'gamedig': 'GameDig',
-            'mqtt': 'MQTT',
-            'sqlserver': 'SQL Server',
-            'postgres': 'PostgreSQL',
-            'mysql': 'MySQL',
-            'mongodb': 'MongoDB',
-            'radius': 'RADIUS'
-        }
-        
         if isinstance(type_value, str):
-            return type_map.get(type_value.lower(), type_value.upper())
+            name = _monitor_type_names.get(type_value)
+            if name is None:
+                name = _monitor_type_names.setdefault(
+                    type_value, _MONITOR_TYPE_MAP.get(type_value.lower(), type_value.upper()))
+            return name
         
         return 'HTTP(s)'  # Default
     
@@ -373,30 +881,26 @@ class UptimeKumaService:
         if not monitor_id:
             raise ValueError("Monitor ID is required")
         
-        api = None
         try:
             api = self._get_api()
             monitor = api.get_monitor(monitor_id)
+            self._remember_interval(monitor)
             
             # Fetch heartbeats
             try:
-                heartbeats = api.get_monitor_beats(monitor_id, hours=24)
-                monitor['_heartbeats'] = heartbeats
+                monitor['_heartbeats'] = self._get_beats(api, monitor_id)
             except Exception as e:
-                logger.warning(f"Could not fetch heartbeats: {e}")
+                logger.warning("Could not fetch heartbeats: %s", e)
                 monitor['_heartbeats'] = []
             
-            logger.info(f"Retrieved monitor {monitor_id}")
+            logger.info("Retrieved monitor %s", monitor_id)
             return self._format_monitor(monitor)
             
         except UptimeKumaException:
             raise
         except Exception as e:
-            logger.error(f"Failed to get monitor {monitor_id}: {e}")
+            logger.error("Failed to get monitor %s: %s", monitor_id, e)
             raise UptimeKumaException(f"Failed to get monitor: {e}")
-        finally:
-            if api:
-                self._disconnect()
     
     def add_monitor(self, name: str, url: Optional[str] = None, 
                    monitor_type: str = 'http', **kwargs) -> Dict[str, Any]:
@@ -427,10 +931,9 @@ class UptimeKumaService:
         if not name:
             raise ValueError("Monitor name is required")
         
-        if monitor_type.lower() in ['http', 'https'] and not url:
+        if monitor_type.lower() in _HTTP_TYPES and not url:
             raise ValueError("URL is required for HTTP monitors")
         
-        api = None
         try:
             api = self._get_api()
             
@@ -441,17 +944,14 @@ class UptimeKumaService:
                 **kwargs
             )
             
-            logger.info(f"Monitor '{name}' created successfully")
+            logger.info("Monitor '%s' created successfully", name)
             return self._format_monitor(monitor)
             
         except UptimeKumaException:
             raise
         except Exception as e:
-            logger.error(f"Failed to add monitor '{name}': {e}")
+            logger.error("Failed to add monitor '%s': %s", name, e)
             raise UptimeKumaException(f"Failed to add monitor: {e}")
-        finally:
-            if api:
-                self._disconnect()
     
     def edit_monitor(self, monitor_id: int, **kwargs) -> bool:
         """
@@ -474,7 +974,6 @@ class UptimeKumaService:
         if not monitor_id:
             raise ValueError("Monitor ID is required")
         
-        api = None
         try:
             api = self._get_api()
             
@@ -488,18 +987,16 @@ class UptimeKumaService:
             
             # Save the monitor
             api.edit_monitor(monitor_id, **monitor)
+            self.invalidate(monitor_id)
             
-            logger.info(f"Monitor {monitor_id} updated successfully")
+            logger.info("Monitor %s updated successfully", monitor_id)
             return True
             
         except UptimeKumaException:
             raise
         except Exception as e:
-            logger.error(f"Failed to edit monitor {monitor_id}: {e}")
+            logger.error("Failed to edit monitor %s: %s", monitor_id, e)
             raise UptimeKumaException(f"Failed to edit monitor: {e}")
-        finally:
-            if api:
-                self._disconnect()
     
     def delete_monitor(self, monitor_id: int) -> bool:
         """
@@ -521,23 +1018,20 @@ class UptimeKumaService:
         if not monitor_id:
             raise ValueError("Monitor ID is required")
         
-        api = None
         try:
             api = self._get_api()
             
             api.delete_monitor(monitor_id)
+            self.invalidate(monitor_id)
             
-            logger.info(f"Monitor {monitor_id} deleted successfully")
+            logger.info("Monitor %s deleted successfully", monitor_id)
             return True
             
         except UptimeKumaException:
             raise
         except Exception as e:
-            logger.error(f"Failed to delete monitor {monitor_id}: {e}")
+            logger.error("Failed to delete monitor %s: %s", monitor_id, e)
             raise UptimeKumaException(f"Failed to delete monitor: {e}")
-        finally:
-            if api:
-                self._disconnect()
     
     def pause_monitor(self, monitor_id: int) -> bool:
         """
@@ -573,13 +1067,7 @@ class UptimeKumaService:
         Returns:
             str: Status text
         """
-        status_map = {
-            self.STATUS_DOWN: 'Down',
-            self.STATUS_UP: 'Up',
-            self.STATUS_PENDING: 'Pending',
-            self.STATUS_MAINTENANCE: 'Maintenance'
-        }
-        return status_map.get(status_code, 'Unknown')
+        return _STATUS_TEXT.get(status_code, 'Unknown')
     
     # ==================== STATUS PAGE METHODS ====================
     
@@ -593,22 +1081,18 @@ class UptimeKumaService:
         Raises:
             UptimeKumaException: If fetching status pages fails
         """
-        api = None
         try:
             api = self._get_api()
             status_pages = api.get_status_pages()
             
-            logger.info(f"Retrieved {len(status_pages)} status pages")
+            logger.info("Retrieved %d status pages", len(status_pages))
             return status_pages
             
         except UptimeKumaException:
             raise
         except Exception as e:
-            logger.error(f"Failed to get status pages: {e}")
+            logger.error("Failed to get status pages: %s", e)
             raise UptimeKumaException(f"Failed to get status pages: {e}")
-        finally:
-            if api:
-                self._disconnect()
     
     def get_status_page(self, slug: str) -> Dict[str, Any]:
         """
@@ -619,26 +1103,31 @@ class UptimeKumaService:
         
         Returns:
             dict: Status page data
+        
+        Raises:
+            ValueError: If slug is missing
+            UptimeKumaNotFoundException: If no status page has this slug
+            UptimeKumaException: If fetching the status page fails
         """
         if not slug:
             raise ValueError("Slug is required")
         
-        api = None
         try:
             api = self._get_api()
             status_page = api.get_status_page(slug)
             
-            logger.info(f"Retrieved status page: {slug}")
+            logger.info("Retrieved status page: %s", slug)
             return status_page
             
         except UptimeKumaException:
             raise
         except Exception as e:
-            logger.error(f"Failed to get status page '{slug}': {e}")
+            # Uptime Kuma answers getStatusPage for an unknown slug with "No slug?"
+            if str(e).startswith('No slug'):
+                logger.warning("Status page '%s' not found", slug)
+                raise UptimeKumaNotFoundException(f"Status page '{slug}' not found")
+            logger.error("Failed to get status page '%s': %s", slug, e)
             raise UptimeKumaException(f"Failed to get status page: {e}")
-        finally:
-            if api:
-                self._disconnect()
     
     def add_status_page(self, slug: str, title: str, **kwargs) -> Dict[str, Any]:
         """
@@ -655,7 +1144,6 @@ class UptimeKumaService:
         if not slug or not title:
             raise ValueError("Slug and title are required")
         
-        api = None
         try:
             api = self._get_api()
             
@@ -665,17 +1153,14 @@ class UptimeKumaService:
                 **kwargs
             )
             
-            logger.info(f"Status page '{title}' created successfully")
+            logger.info("Status page '%s' created successfully", title)
             return status_page
             
         except UptimeKumaException:
             raise
         except Exception as e:
-            logger.error(f"Failed to add status page '{title}': {e}")
+            logger.error("Failed to add status page '%s': %s", title, e)
             raise UptimeKumaException(f"Failed to add status page: {e}")
-        finally:
-            if api:
-                self._disconnect()
     
     def save_status_page(self, slug: str, **kwargs) -> bool:
         """
@@ -691,23 +1176,19 @@ class UptimeKumaService:
         if not slug:
             raise ValueError("Slug is required")
         
-        api = None
         try:
             api = self._get_api()
             
             api.save_status_page(slug, **kwargs)
             
-            logger.info(f"Status page '{slug}' saved successfully")
+            logger.info("Status page '%s' saved successfully", slug)
             return True
             
         except UptimeKumaException:
             raise
         except Exception as e:
-            logger.error(f"Failed to save status page '{slug}': {e}")
+            logger.error("Failed to save status page '%s': %s", slug, e)
             raise UptimeKumaException(f"Failed to save status page: {e}")
-        finally:
-            if api:
-                self._disconnect()
     
     def delete_status_page(self, slug: str) -> bool:
         """
@@ -722,20 +1203,20 @@ class UptimeKumaService:
         if not slug:
             raise ValueError("Slug is required")
         
-        api = None
         try:
             api = self._get_api()
             
             api.delete_status_page(slug)
             
-            logger.info(f"Status page '{slug}' deleted successfully")
+            logger.info("Status page '%s' deleted successfully", slug)
             return True
             
         except UptimeKumaException:
             raise
         except Exception as e:
-            logger.error(f"Failed to delete status page '{slug}': {e}")
+            logger.error("Failed to delete status page '%s': %s", slug, e)
             raise UptimeKumaException(f"Failed to delete status page: {e}")
-        finally:
-            if api:
-                self._disconnect()
\ No newline at end of file
+
+
+# Disconnect pooled connections when the interpreter exits
+atexit.register(UptimeKumaService.close_all)
@@ -15,18 +15,62 @@ Usage:
 """
 
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as _UrllibError
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import MappingProxyType
+from urllib.parse import urlencode
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cache import TTLCache
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+import copy
 import logging
+import random
+import statistics
+import threading
+import time
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Status text by status code (see UptimeRobotService.STATUS_*)
+_STATUS_TEXT = MappingProxyType({
+    0: 'Paused',
+    1: 'Not Checked',
+    2: 'Up',
+    8: 'Seems Down',
+    9: 'Down'
+})
+
+
+def _join_ids(ids) -> str:
+    """Format IDs as the dash-separated list the API expects (e.g. '1-2-3')."""
+    return '-'.join([f'{i}' for i in ids])
+
 
 class UptimeRobotException(Exception):
     """Custom exception for Uptime Robot API errors"""
     pass
 
 
+class UptimeRobotNotFoundException(UptimeRobotException):
+    """Raised when a requested Uptime Robot resource does not exist"""
+    pass
+
+
 class UptimeRobotService:
     """
     Service class for interacting with Uptime Robot API.
@@ -37,17 +81,69 @@ class UptimeRobotService:
     Attributes:
         api_key (str): The Uptime Robot API key
         base_url (str): Base URL for Uptime Robot API
-        timeout (int): Request timeout in seconds
+        timeout (tuple): (connect, read) request timeouts in seconds
+        session (requests.Session): Session reused for every request
     
     Example:
-        >>> service = UptimeRobotService(api_key="ur123456...")
-        >>> monitors = service.get_monitors()
-        >>> print(f"Found {len(monitors)} monitors")
+        >>> with UptimeRobotService(api_key="ur123456...") as service:
+        ...     monitors = service.get_monitors()
+        ...     print(f"Found {len(monitors)} monitors")
     """
     
     # API Constants
     BASE_URL = "https://api.uptimerobot.com/v2"
     DEFAULT_TIMEOUT = 10
+    # Slightly over a multiple of 3s, the TCP retransmission window
+    CONNECT_TIMEOUT = 3.05
+    DEFAULT_CACHE_TTL = 30
+    
+    # Endpoints this service calls (their URLs are built once per instance)
+    ENDPOINTS = ('getMonitors', 'newMonitor', 'editMonitor', 'deleteMonitor',
+                 'getPSPs', 'newPSP', 'editPSP', 'deletePSP')
+    
+    # Read-only endpoints; any other request clears the response cache
+    READ_ENDPOINTS = frozenset({'getMonitors', 'getPSPs'})
+    
+    # Connection pool sizing for the service's own session
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 20
+    
+    # Retries for transient failures: exponential backoff with jitter
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+    RETRY_JITTER = 0.5
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    
+    # Endpoints that create resources; a failure after sending may still have
+    # created one, so these are only retried on 429 (request not processed)
+    NON_IDEMPOTENT_ENDPOINTS = frozenset({'newMonitor', 'newPSP'})
+    
+    # Responses at least this large are stream-parsed when ijson is installed
+    STREAM_MIN_BYTES = 64 * 1024
+    
+    # Consecutive network/5xx failures that open the circuit, and seconds it stays open
+    BREAKER_FAILURE_THRESHOLD = 5
+    BREAKER_RESET_TIMEOUT = 30
+    
+    # Request latencies kept per endpoint for get_latency_stats
+    LATENCY_SAMPLES = 1000
+    
+    # Concurrent requests per bulk operation, kept low to respect rate limits
+    BULK_CONCURRENCY = 10
+    
+    # Headers sent with every request. Like FORM_HEADERS, they are set on the
+    # prepared requests only, never on a (possibly shared) session.
+    DEFAULT_HEADERS = {
+        'Cache-Control': 'no-cache',
+        'Accept': 'application/json',
+        # Always ask for compression (gzip, deflate, plus br when brotli is
+        # installed), whatever the session's own defaults are
+        'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING
+    }
+    
+    # Bodies are sent pre-encoded, so requests doesn't set this itself
+    FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
     
     # Monitor types
     MONITOR_TYPE_HTTP = 1
@@ -62,13 +158,20 @@ class UptimeRobotService:
     STATUS_SEEMS_DOWN = 8
     STATUS_DOWN = 9
     
-    def __init__(self, api_key: str, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(self, api_key: str, timeout: int = DEFAULT_TIMEOUT,
+                 session: Optional[requests.Session] = None,
+                 cache_ttl: float = DEFAULT_CACHE_TTL):
         """
         Initialize the Uptime Robot service.
         
         Args:
             api_key: Uptime Robot API key (starts with 'ur')
-            timeout: Request timeout in seconds (default: 10)
+            timeout: Read timeout in seconds (default: 10); connecting is
+                limited to CONNECT_TIMEOUT so unreachable hosts fail fast
+            session: Shared requests.Session to send requests through (optional).
+                When omitted, the service creates and owns a pooled session.
+            cache_ttl: Seconds to reuse get_monitors/get_status_pages responses
+                (default: 30, 0 disables caching)
         
         Raises:
             ValueError: If api_key is empty or invalid
@@ -81,17 +184,266 @@ class UptimeRobotService:
         
         self.api_key = api_key
         self.base_url = self.BASE_URL
-        self.timeout = timeout
+        self._urls = {endpoint: f"{self.base_url}/{endpoint}" for endpoint in self.ENDPOINTS}
+        self.timeout = (min(self.CONNECT_TIMEOUT, timeout), timeout)
+        # Form fields sent with every request, encoded once
+        self._static_body = urlencode({'api_key': api_key, 'format': 'json'})
+        # Only a session created here is closed by close()
+        self._owns_session = session is None
+        self.session = session if session is not None else self._create_session()
+        # Requests are prepared once per endpoint and only the body changes per
+        # call, so later changes to session headers or cookies aren't picked up
+        self._prepared = {endpoint: self._template(url) for endpoint, url in self._urls.items()}
+        # Proxy/verify/cert settings session.post would merge in from the environment
+        self._send_settings = self.session.merge_environment_settings(
+            self.base_url, {}, None, None, None)
+        self._send_settings.pop('stream', None)
+        # Parsed read responses keyed by (endpoint, frozenset(payload.items()))
+        self.cache_ttl = cache_ttl
+        self._cache = TTLCache(ttl=cache_ttl, maxsize=32)
+        # Fails fast during outages instead of waiting out the timeout on every call
+        self._breaker = CircuitBreaker(failure_threshold=self.BREAKER_FAILURE_THRESHOLD,
+                                       reset_timeout=self.BREAKER_RESET_TIMEOUT,
+                                       name='Uptime Robot')
+        # Recent request durations in seconds, keyed by endpoint
+        self._latency: Dict[str, deque] = {}
+        self._latency_lock = threading.Lock()
+        # Whether the encoding of a getMonitors response has been logged yet
+        self._encoding_logged = False
         
         logger.info("UptimeRobotService initialized")
     
-    def _make_request(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        """Create a session whose keep-alive connections are reused across requests."""
+        session = requests.Session()
+        # Retries are handled per endpoint in _post, not by the adapter
+        adapter = HTTPAdapter(
+            pool_connections=cls.POOL_CONNECTIONS,
+            pool_maxsize=cls.POOL_MAXSIZE
+        )
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self):
+        """Close the HTTP session if this service created it."""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _retry_delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)."""
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+        return delay * (1 + random.uniform(0, self.RETRY_JITTER))
+    
+    def _post(self, endpoint: str, url: str, body: bytes,
+              stream: bool = False) -> requests.Response:
+        """
+        POST to the API, retrying timeouts, connection errors and retryable statuses.
+        
+        Args:
+            endpoint: API endpoint name, used to decide whether retrying is safe
+            url: Full request URL
+            body: Form-encoded request body
+            stream: Leave the body unread for incremental parsing (default: False)
+        
+        Returns:
+            requests.Response: The last response received
+        
+        Raises:
+            requests.exceptions.RequestException: If the final attempt fails
+        """
+        idempotent = endpoint not in self.NON_IDEMPOTENT_ENDPOINTS
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = self.session.send(self._prepare(endpoint, url, body),
+                                             timeout=self.timeout, stream=stream,
+                                             **self._send_settings)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                if not idempotent or attempt >= self.MAX_RETRIES:
+                    raise
+                reason = type(e).__name__
+            else:
+                self._record_latency(endpoint, time.perf_counter() - start)
+                status = response.status_code
+                if (status not in self.RETRY_STATUSES or attempt >= self.MAX_RETRIES
+                        or (status != 429 and not idempotent)):
+                    return response
+                reason = f"HTTP {status}"
+                response.close()
+            
+            delay = self._retry_delay(attempt)
+            attempt += 1
+            logger.warning("%s failed (%s), retrying in %.1fs (attempt %d of %d)",
+                           endpoint, reason, delay, attempt, self.MAX_RETRIES)
+            time.sleep(delay)
+    
+    def _template(self, url: str) -> requests.PreparedRequest:
+        """Prepare a bodiless POST to `url` with the service's headers on top of the session's."""
+        return self.session.prepare_request(
+            requests.Request('POST', url, headers={**self.DEFAULT_HEADERS, **self.FORM_HEADERS}))
+    
+    def _prepare(self, endpoint: str, url: str, body: bytes) -> requests.PreparedRequest:
+        """Copy the endpoint's prepared request template and attach `body`."""
+        template = self._prepared.get(endpoint)
+        if template is None:
+            template = self._template(url)
+        prepared = template.copy()
+        prepared.body = body
+        prepared.headers['Content-Length'] = str(len(body))
+        return prepared
+    
+    def _record_latency(self, endpoint: str, elapsed: float):
+        """Record how long one request to `endpoint` took to get a response."""
+        with self._latency_lock:
+            samples = self._latency.get(endpoint)
+            if samples is None:
+                samples = self._latency[endpoint] = deque(maxlen=self.LATENCY_SAMPLES)
+            samples.append(elapsed)
+    
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize recent request latencies per endpoint.
+        
+        Durations run until the response headers arrive, one sample per
+        attempt that got a response (retries included), over the last
+        LATENCY_SAMPLES requests to each endpoint. Useful for choosing a
+        read timeout above p95.
+        
+        Returns:
+            dict: {endpoint: {'count', 'p50_ms', 'p95_ms', 'p99_ms'}}
+        
+        Example:
+            >>> service.get_latency_stats()['getMonitors']['p95_ms']
+            412.7
+        """
+        with self._latency_lock:
+            snapshot = {endpoint: list(samples) for endpoint, samples in self._latency.items()}
+        
+        stats = {}
+        for endpoint, samples in snapshot.items():
+            if len(samples) > 1:
+                cuts = statistics.quantiles(samples, n=100, method='inclusive')
+                p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+            else:
+                p50 = p95 = p99 = samples[0]
+            stats[endpoint] = {
+                'count': len(samples),
+                'p50_ms': round(p50 * 1000, 1),
+                'p95_ms': round(p95 * 1000, 1),
+                'p99_ms': round(p99 * 1000, 1)
+            }
+        return stats
+    
+    def invalidate_cache(self):
+        """Drop all cached responses so the next read goes to the API."""
+        self._cache.clear()
+    
+    def _post_checked(self, endpoint: str, url: str, body: bytes,
+                      stream: bool = False) -> requests.Response:
+        """Like _post, but raises requests.exceptions.HTTPError for 5xx responses."""
+        response = self._post(endpoint, url, body, stream=stream)
+        if response.status_code >= 500:
+            response.close()
+            response.raise_for_status()
+        return response
+    
+    def _cached_request(self, endpoint: str, payload: Dict[str, Any],
+                        stream_items: Optional[Tuple[str, Callable]] = None) -> Dict[str, Any]:
+        """
+        Make a read request, reusing a response received in the last cache_ttl seconds.
+        
+        The returned data is shared with the cache and must not be modified.
+        
+        Args:
+            endpoint: Read-only API endpoint (e.g., 'getMonitors')
+            payload: Request payload
+            stream_items: Passed to _make_request
+        
+        Returns:
+            dict: API response data
+        """
+        def load():
+            return self._make_request(endpoint, payload, stream_items=stream_items)
+        
+        if self.cache_ttl <= 0:
+            return load()
+        return self._cache.get_or_load((endpoint, frozenset(payload.items())), load)
+    
+    def _parse_items(self, response: requests.Response, key: str,
+                     transform: Callable) -> Dict[str, Any]:
+        """
+        Parse a response, passing each element of its `key` list through `transform`.
+        
+        Large bodies are parsed incrementally with ijson, so only one raw
+        element is in memory at a time instead of the whole decoded list.
+        Only the top-level scalars and the error object are kept alongside
+        the transformed list.
+        
+        Args:
+            response: Response opened with stream=True
+            key: Top-level key holding the list (e.g., 'monitors')
+            transform: Called with each raw element
+        
+        Returns:
+            dict: Response data with data[key] replaced by the transformed elements
+        """
+        length = response.headers.get('Content-Length')
+        if ijson is None or (length is not None and int(length) < self.STREAM_MIN_BYTES):
+            data = _json_loads(response.content)
+            if not isinstance(data, dict) or not isinstance(data.get(key, []), list):
+                raise UptimeRobotException(
+                    f"Malformed response - expected an object with a '{key}' list")
+            data[key] = [transform(item) for item in data.get(key, [])]
+            return data
+        
+        item_prefix = f'{key}.item'
+        items = []
+        data = {key: items}
+        builder = None
+        # Let urllib3 undo gzip/deflate as ijson reads the raw stream
+        response.raw.decode_content = True
+        try:
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == item_prefix and event == 'end_map':
+                        items.append(transform(builder.value))
+                        builder = None
+                elif prefix == item_prefix and event == 'start_map':
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif event in ('string', 'number', 'boolean', 'null'):
+                    if '.' not in prefix:
+                        data[prefix] = value
+                    elif prefix.startswith('error.'):
+                        data.setdefault('error', {})[prefix[len('error.'):]] = value
+        except ijson.JSONError as e:
+            raise ValueError(str(e))
+        except _UrllibError as e:
+            # Reading response.raw bypasses requests' exception wrapping
+            raise requests.exceptions.ConnectionError(e)
+        finally:
+            response.close()
+        return data
+    
+    def _make_request(self, endpoint: str, payload: Dict[str, Any],
+                      stream_items: Optional[Tuple[str, Callable]] = None) -> Dict[str, Any]:
         """
         Make a POST request to the Uptime Robot API.
         
         Args:
             endpoint: API endpoint (e.g., 'getMonitors')
             payload: Request payload (api_key will be added automatically)
+            stream_items: (key, transform) to apply transform to each element
+                of data[key] as it is parsed (see _parse_items)
         
         Returns:
             dict: API response data
@@ -99,30 +451,64 @@ class UptimeRobotService:
         Raises:
             UptimeRobotException: If the API request fails
         """
-        url = f"{self.base_url}/{endpoint}"
+        # Append the payload to the pre-encoded api_key and format fields,
+        # leaving out None values as requests' own form encoding does
+        body = self._static_body
+        fields = {key: value for key, value in payload.items() if value is not None}
+        if fields:
+            body = f"{body}&{urlencode(fields, doseq=True)}"
+        
+        return self._send(endpoint, body.encode('ascii'), stream_items=stream_items)
+    
+    def _send(self, endpoint: str, body: bytes,
+              stream_items: Optional[Tuple[str, Callable]] = None) -> Dict[str, Any]:
+        """
+        Send a fully encoded request body and check the API response.
         
-        # Add API key and format to payload
-        full_payload = {
-            'api_key': self.api_key,
-            'format': 'json',
-            **payload
-        }
+        Args:
+            endpoint: API endpoint (e.g., 'getMonitors')
+            body: Form-encoded body, including api_key and format
+            stream_items: See _make_request
+        
+        Returns:
+            dict: API response data
+        
+        Raises:
+            UptimeRobotException: If the API request fails
+        """
+        url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint}"
         
         try:
-            logger.debug(f"Making request to {endpoint}")
-            response = requests.post(url, data=full_payload, timeout=self.timeout)
+            logger.debug("Making request to %s", endpoint)
+            # Only network errors and 5xx responses count against the breaker;
+            # API errors mean Uptime Robot is up and answering
+            response = self._breaker.call(self._post_checked, endpoint, url, body,
+                                          stream=stream_items is not None)
             response.raise_for_status()
             
-            data = response.json()
+            if endpoint == 'getMonitors' and not self._encoding_logged:
+                self._encoding_logged = True
+                logger.debug("getMonitors response Content-Encoding: %s",
+                             response.headers.get('Content-Encoding', 'none (uncompressed)'))
+            
+            # Parse the raw bytes; both parsers raise ValueError subclasses
+            if stream_items is not None:
+                data = self._parse_items(response, *stream_items)
+            else:
+                data = _json_loads(response.content)
             
-            # Check API response status
-            if data.get('stat') != 'ok':
-                error_msg = data.get('error', {}).get('message', 'Unknown error')
-                error_type = data.get('error', {}).get('type', 'unknown')
-                raise UptimeRobotException(f"API Error ({error_type}): {error_msg}")
+            # Check API response status; every valid response includes 'stat'
+            try:
+                stat = data['stat']
+            except (KeyError, TypeError):
+                raise UptimeRobotException("Malformed response - missing 'stat'")
+            if stat != 'ok':
+                self._raise_api_error(data)
             
             return data
             
+        except CircuitOpenError as e:
+            raise UptimeRobotException(str(e))
         except requests.exceptions.Timeout:
             raise UptimeRobotException("Request timeout - Uptime Robot API not responding")
         except requests.exceptions.ConnectionError:
@@ -131,6 +517,18 @@ class UptimeRobotService:
             raise UptimeRobotException(f"Request error: {str(e)}")
         except ValueError as e:
             raise UptimeRobotException(f"Invalid JSON response: {str(e)}")
+        finally:
+            # Even a failed write may have been applied, so never serve stale reads after one
+            if endpoint not in self.READ_ENDPOINTS:
+                self.invalidate_cache()
+    
+    @staticmethod
+    def _raise_api_error(data: Dict[str, Any]):
+        """Raise UptimeRobotException describing the error in a failed API response."""
+        error = data.get('error') or {}
+        error_msg = error.get('message', 'Unknown error')
+        error_type = error.get('type', 'unknown')
+        raise UptimeRobotException(f"API Error ({error_type}): {error_msg}")
     
     def get_monitors(self) -> List[Dict[str, Any]]:
         """
@@ -151,17 +549,18 @@ class UptimeRobotService:
                 'response_times': '1'
             }
             
-            data = self._make_request('getMonitors', payload)
+            # Monitors are formatted as they are parsed, and cached formatted
+            data = self._cached_request('getMonitors', payload,
+                                        stream_items=('monitors', self._format_monitor))
             
-            monitors = []
-            for monitor in data.get('monitors', []):
-                monitors.append(self._format_monitor(monitor))
+            # Copy so callers can't modify the cached monitors
+            monitors = [dict(monitor) for monitor in data['monitors']]
             
-            logger.info(f"Retrieved {len(monitors)} monitors")
+            logger.info("Retrieved %d monitors", len(monitors))
             return monitors
             
         except UptimeRobotException as e:
-            logger.error(f"Failed to get monitors: {e}")
+            logger.error("Failed to get monitors: %s", e)
             raise
     
     def _format_monitor(self, monitor: Dict[str, Any]) -> Dict[str, Any]:
@@ -174,15 +573,17 @@ class UptimeRobotService:
         Returns:
             dict: Formatted monitor data
         """
+        # Runs once per monitor; bind the lookup once instead of per field
+        get = monitor.get
         return {
-            'id': monitor.get('id'),
-            'name': monitor.get('friendly_name', 'Unknown'),
-            'url': monitor.get('url', 'N/A'),
-            'status': monitor.get('status', 0),
-            'uptime_ratio': monitor.get('custom_uptime_ratio', 'N/A'),
-            'response_time': monitor.get('average_response_time', 'N/A'),
-            'type': monitor.get('type'),
-            'interval': monitor.get('interval', 300)
+            'id': get('id'),
+            'name': get('friendly_name', 'Unknown'),
+            'url': get('url', 'N/A'),
+            'status': get('status', 0),
+            'uptime_ratio': get('custom_uptime_ratio', 'N/A'),
+            'response_time': get('average_response_time', 'N/A'),
+            'type': get('type'),
+            'interval': get('interval', 300)
         }
     
     def add_monitor(self, name: str, url: str, monitor_type: int = MONITOR_TYPE_HTTP,
@@ -224,11 +625,11 @@ class UptimeRobotService:
         
         try:
             data = self._make_request('newMonitor', payload)
-            logger.info(f"Monitor '{name}' created successfully")
+            logger.info("Monitor '%s' created successfully", name)
             return data.get('monitor', {})
             
         except UptimeRobotException as e:
-            logger.error(f"Failed to add monitor '{name}': {e}")
+            logger.error("Failed to add monitor '%s': %s", name, e)
             raise
     
     def edit_monitor(self, monitor_id: int, **kwargs) -> bool:
@@ -260,11 +661,11 @@ class UptimeRobotService:
         
         try:
             self._make_request('editMonitor', payload)
-            logger.info(f"Monitor {monitor_id} updated successfully")
+            logger.info("Monitor %s updated successfully", monitor_id)
             return True
             
         except UptimeRobotException as e:
-            logger.error(f"Failed to edit monitor {monitor_id}: {e}")
+            logger.error("Failed to edit monitor %s: %s", monitor_id, e)
             raise
     
     def delete_monitor(self, monitor_id: int) -> bool:
@@ -291,13 +692,74 @@ class UptimeRobotService:
         
         try:
             self._make_request('deleteMonitor', payload)
-            logger.info(f"Monitor {monitor_id} deleted successfully")
+            logger.info("Monitor %s deleted successfully", monitor_id)
             return True
             
         except UptimeRobotException as e:
-            logger.error(f"Failed to delete monitor {monitor_id}: {e}")
+            logger.error("Failed to delete monitor %s: %s", monitor_id, e)
             raise
     
+    def _run_bulk(self, calls: Dict[int, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Run independent monitor operations concurrently.
+        
+        Args:
+            calls: Zero-argument callables keyed by the monitor ID they act on
+        
+        Returns:
+            dict: {'succeeded': [ids], 'failed': {id: error message}}
+        """
+        result = {'succeeded': [], 'failed': {}}
+        if not calls:
+            return result
+        
+        workers = min(self.BULK_CONCURRENCY, len(calls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='robot-bulk') as pool:
+            futures = [(monitor_id, pool.submit(call)) for monitor_id, call in calls.items()]
+            for monitor_id, future in futures:
+                try:
+                    future.result()
+                    result['succeeded'].append(monitor_id)
+                except (TypeError, ValueError, UptimeRobotException) as e:
+                    result['failed'][monitor_id] = str(e)
+        
+        logger.info("Bulk operation: %d succeeded, %d failed",
+                    len(result['succeeded']), len(result['failed']))
+        return result
+    
+    def edit_monitors_bulk(self, updates: List[Tuple[int, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Edit several monitors concurrently.
+        
+        Args:
+            updates: (monitor_id, fields) pairs, fields as for edit_monitor
+        
+        Returns:
+            dict: {'succeeded': [ids], 'failed': {id: error message}}
+        
+        Example:
+            >>> service.edit_monitors_bulk([(12345, {'interval': 600}),
+            ...                             (67890, {'friendly_name': 'API'})])
+        """
+        return self._run_bulk({
+            monitor_id: partial(self.edit_monitor, monitor_id, **fields)
+            for monitor_id, fields in updates
+        })
+    
+    def delete_monitors_bulk(self, monitor_ids: List[int]) -> Dict[str, Any]:
+        """
+        Delete several monitors concurrently.
+        
+        Args:
+            monitor_ids: IDs of the monitors to delete
+        
+        Returns:
+            dict: {'succeeded': [ids], 'failed': {id: error message}}
+        """
+        return self._run_bulk({
+            monitor_id: partial(self.delete_monitor, monitor_id) for monitor_id in monitor_ids
+        })
+    
     def pause_monitor(self, monitor_id: int) -> bool:
         """
         Pause a monitor.
@@ -322,6 +784,59 @@ class UptimeRobotService:
         """
         return self.edit_monitor(monitor_id, status=self.STATUS_UP)
     
+    def _set_status_bulk(self, monitor_ids: List[int], status: int) -> Dict[str, Any]:
+        """
+        Set the status of several monitors concurrently.
+        
+        Only the monitor ID differs between requests, so the rest of the
+        editMonitor body is encoded once and each ID is appended to it.
+        
+        Args:
+            monitor_ids: IDs of the monitors to update
+            status: New status (STATUS_PAUSED or STATUS_UP)
+        
+        Returns:
+            dict: {'succeeded': [ids], 'failed': {id: error message}}
+        """
+        prefix = f"{self._static_body}&status={int(status)}&id="
+        
+        def send(monitor_id):
+            # Only a plain integer ID may be appended to the body
+            try:
+                monitor_id = int(monitor_id)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid monitor ID: {monitor_id!r}")
+            self._send('editMonitor', f"{prefix}{monitor_id}".encode('ascii'))
+        
+        return self._run_bulk({monitor_id: partial(send, monitor_id) for monitor_id in monitor_ids})
+    
+    def pause_monitors(self, monitor_ids: List[int]) -> Dict[str, Any]:
+        """
+        Pause several monitors concurrently.
+        
+        Args:
+            monitor_ids: IDs of the monitors to pause
+        
+        Returns:
+            dict: {'succeeded': [ids], 'failed': {id: error message}}
+        
+        Example:
+            >>> service.pause_monitors([12345, 67890])
+        """
+        return self._set_status_bulk(monitor_ids, self.STATUS_PAUSED)
+    
+    def resume_monitors(self, monitor_ids: List[int]) -> Dict[str, Any]:
+        """
+        Resume several paused monitors concurrently.
+        
+        Args:
+            monitor_ids: IDs of the monitors to resume
+        
+        Returns:
+            dict: {'succeeded': [ids], 'failed': {id: error message}}
+        """
+        return self._set_status_bulk(monitor_ids, self.STATUS_UP)
+    
     def get_status_text(self, status_code: int) -> str:
         """
         Get human-readable status text.
@@ -332,14 +847,7 @@ class UptimeRobotService:
         Returns:
             str: Status text
         """
-        status_map = {
-            self.STATUS_PAUSED: 'Paused',
-            self.STATUS_NOT_CHECKED: 'Not Checked',
-            self.STATUS_UP: 'Up',
-            self.STATUS_SEEMS_DOWN: 'Seems Down',
-            self.STATUS_DOWN: 'Down'
-        }
-        return status_map.get(status_code, 'Unknown')
+        return _STATUS_TEXT.get(status_code, 'Unknown')
     
     # ==================== STATUS PAGE (PSP) METHODS ====================
     
@@ -359,14 +867,46 @@ class UptimeRobotService:
             ...     print(f"{page['friendly_name']}: {page['custom_url']}")
         """
         try:
-            data = self._make_request('getPSPs', {})
+            data = self._cached_request('getPSPs', {})
+            
+            # Copy so callers can't modify the cached response
+            psps = copy.deepcopy(data.get('psps', []))
+            logger.info("Retrieved %d status pages", len(psps))
+            return psps
+            
+        except UptimeRobotException as e:
+            logger.error("Failed to get status pages: %s", e)
+            raise
+    
+    def get_status_pages_by_ids(self, psp_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get several status pages in a single request.
+        
+        Args:
+            psp_ids: Status page IDs
+        
+        Returns:
+            list: The status pages that exist, in the order the API returns them
+        
+        Raises:
+            ValueError: If psp_ids is empty
+            UptimeRobotException: If fetching status pages fails
+        
+        Example:
+            >>> pages = service.get_status_pages_by_ids([12345, 67890])
+        """
+        if not psp_ids:
+            raise ValueError("Status page IDs are required")
+        
+        try:
+            data = self._make_request('getPSPs', {'psps': _join_ids(psp_ids)})
             
             psps = data.get('psps', [])
-            logger.info(f"Retrieved {len(psps)} status pages")
+            logger.info("Retrieved %d of %d requested status pages", len(psps), len(psp_ids))
             return psps
             
         except UptimeRobotException as e:
-            logger.error(f"Failed to get status pages: {e}")
+            logger.error("Failed to get status pages %s: %s", psp_ids, e)
             raise
     
     def get_status_page(self, psp_id: int) -> Dict[str, Any]:
@@ -381,6 +921,7 @@ class UptimeRobotService:
         
         Raises:
             ValueError: If psp_id is missing
+            UptimeRobotNotFoundException: If no status page has this ID
             UptimeRobotException: If fetching status page fails
         
         Example:
@@ -390,19 +931,13 @@ class UptimeRobotService:
         if not psp_id:
             raise ValueError("Status page ID is required")
         
-        try:
-            data = self._make_request('getPSPs', {'psps': psp_id})
-            
-            psps = data.get('psps', [])
-            if psps:
-                logger.info(f"Retrieved status page: {psp_id}")
-                return psps[0]
-            else:
-                raise UptimeRobotException(f"Status page {psp_id} not found")
-            
-        except UptimeRobotException as e:
-            logger.error(f"Failed to get status page {psp_id}: {e}")
-            raise
+        psps = self.get_status_pages_by_ids([psp_id])
+        if psps:
+            logger.info("Retrieved status page: %s", psp_id)
+            return psps[0]
+        
+        logger.error("Failed to get status page %s: not found", psp_id)
+        raise UptimeRobotNotFoundException(f"Status page {psp_id} not found")
     
     def add_status_page(self, friendly_name: str, monitors: List[int], 
                         custom_url: str = None, **kwargs) -> Dict[str, Any]:
@@ -434,7 +969,7 @@ class UptimeRobotService:
         
         payload = {
             'friendly_name': friendly_name,
-            'monitors': '-'.join(map(str, monitors)),  # Monitor IDs separated by dash
+            'monitors': _join_ids(monitors),
             **kwargs
         }
         
@@ -443,11 +978,11 @@ class UptimeRobotService:
         
         try:
             data = self._make_request('newPSP', payload)
-            logger.info(f"Status page '{friendly_name}' created successfully")
+            logger.info("Status page '%s' created successfully", friendly_name)
             return data.get('psp', {})
             
         except UptimeRobotException as e:
-            logger.error(f"Failed to add status page '{friendly_name}': {e}")
+            logger.error("Failed to add status page '%s': %s", friendly_name, e)
             raise
     
     def edit_status_page(self, psp_id: int, **kwargs) -> bool:
@@ -479,15 +1014,15 @@ class UptimeRobotService:
         
         # Convert monitors list to dash-separated string if provided
         if 'monitors' in kwargs and isinstance(kwargs['monitors'], list):
-            payload['monitors'] = '-'.join(map(str, kwargs['monitors']))
+            payload['monitors'] = _join_ids(kwargs['monitors'])
         
         try:
             self._make_request('editPSP', payload)
-            logger.info(f"Status page {psp_id} updated successfully")
+            logger.info("Status page %s updated successfully", psp_id)
             return True
             
         except UptimeRobotException as e:
-            logger.error(f"Failed to edit status page {psp_id}: {e}")
+            logger.error("Failed to edit status page %s: %s", psp_id, e)
             raise
     
     def delete_status_page(self, psp_id: int) -> bool:
@@ -514,9 +1049,9 @@ class UptimeRobotService:
         
         try:
             self._make_request('deletePSP', payload)
-            logger.info(f"Status page {psp_id} deleted successfully")
+            logger.info("Status page %s deleted successfully", psp_id)
             return True
             
         except UptimeRobotException as e:
-            logger.error(f"Failed to delete status page {psp_id}: {e}")
+            logger.error("Failed to delete status page %s: %s", psp_id, e)
             raise
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Tests for TTLCache.
+
+Run with:
+    python -m unittest discover -s tests
+"""
+
+import threading
+import unittest
+
+from services.cache import TTLCache
+
+
+class GetOrLoadTests(unittest.TestCase):
+
+    def test_load_started_before_invalidate_is_not_stored(self):
+        cache = TTLCache(ttl=60)
+        loading = threading.Event()
+        release = threading.Event()
+
+        def stale_loader():
+            loading.set()
+            release.wait(5)
+            return 'stale'
+
+        thread = threading.Thread(target=cache.get_or_load, args=('key', stale_loader))
+        thread.start()
+        loading.wait(5)
+        cache.invalidate('key')
+        release.set()
+        thread.join(5)
+
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(cache.get_or_load('key', lambda: 'fresh'), 'fresh')
+        self.assertEqual(cache.get('key'), 'fresh')
+
+
+if __name__ == '__main__':
+    unittest.main()
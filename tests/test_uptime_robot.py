@@ -0,0 +1,99 @@
+"""
+Tests for UptimeRobotService request handling.
+
+Requests never leave the process: the service's session.send is replaced
+with a stub that records each prepared request and returns a canned reply.
+
+Run with:
+    python -m unittest discover -s tests
+"""
+
+import unittest
+
+import requests
+
+from services.uptime_robot import UptimeRobotException, UptimeRobotService
+
+
+class StubSend:
+    """Stand-in for session.send that records requests and answers 'ok'."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, prepared, **kwargs):
+        self.requests.append(prepared)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"stat": "ok"}'
+        return response
+
+
+class RequestBodyTests(unittest.TestCase):
+
+    def setUp(self):
+        self.service = UptimeRobotService(api_key='ur-test')
+        self.send = StubSend()
+        self.service.session.send = self.send
+
+    def test_none_fields_are_not_sent(self):
+        self.service.add_status_page('Production', [1, 2], custom_domain=None)
+
+        body = self.send.requests[0].body.decode('ascii')
+        self.assertNotIn('custom_domain', body)
+        self.assertIn('friendly_name=Production', body)
+        self.assertIn('monitors=1-2', body)
+
+    def test_service_headers_stay_off_a_shared_session(self):
+        shared = requests.Session()
+        original_headers = dict(shared.headers)
+        service = UptimeRobotService(api_key='ur-test', session=shared)
+        service.session.send = self.send
+
+        service.delete_monitor(1)
+
+        self.assertEqual(dict(shared.headers), original_headers)
+        sent = self.send.requests[0].headers
+        self.assertEqual(sent['Content-Type'], 'application/x-www-form-urlencoded')
+        for name, value in UptimeRobotService.DEFAULT_HEADERS.items():
+            self.assertEqual(sent[name], value)
+
+
+class MalformedResponseTests(unittest.TestCase):
+
+    def test_non_object_body_raises_service_error(self):
+        service = UptimeRobotService(api_key='ur-test', cache_ttl=0)
+
+        for content in (b'[1, 2]', b'"x"', b'{"stat": "ok", "monitors": 5}'):
+            def send(prepared, _content=content, **kwargs):
+                response = requests.Response()
+                response.status_code = 200
+                response.headers['Content-Length'] = str(len(_content))
+                response._content = _content
+                return response
+            service.session.send = send
+
+            with self.subTest(content=content):
+                with self.assertRaisesRegex(UptimeRobotException, 'Malformed response'):
+                    service.get_monitors()
+        self.assertEqual(service._breaker.state, service._breaker.CLOSED)
+
+
+class BulkTests(unittest.TestCase):
+
+    def setUp(self):
+        self.service = UptimeRobotService(api_key='ur-test')
+        self.send = StubSend()
+        self.service.session.send = self.send
+
+    def test_invalid_id_fails_only_its_entry(self):
+        result = self.service.pause_monitors([1, None, 'abc'])
+
+        self.assertEqual(result['succeeded'], [1])
+        self.assertEqual(set(result['failed']), {None, 'abc'})
+        self.assertEqual(len(self.send.requests), 1)
+        self.assertIn(b'status=0&id=1', self.send.requests[0].body)
+
+
+if __name__ == '__main__':
+    unittest.main()